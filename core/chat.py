@@ -165,7 +165,7 @@ class ChatManager:
         # 按时间排序
         all_messages.sort(key=lambda x: x.get("timestamp", ""))
         return all_messages
-    
+
     def chat(self, user_message, stream_callback=None):
         """发送消息"""
         if not self.current_model:
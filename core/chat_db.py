@@ -452,7 +452,20 @@ class ChatManager:
         
         messages = self.db.get_messages(self.current_chat_id)
         return messages
-    
+
+    def get_last_assistant_and_count(self) -> tuple:
+        """一次遍历返回 (最后一条 AI 消息, AI 消息总数)
+
+        推荐生成每次 AI 回复后都要这两个值，单独扫描两遍没有必要。
+        """
+        last_ai_msg = None
+        ai_msg_count = 0
+        for msg in self.get_all_messages_sorted():
+            if msg.get("role") == "assistant":
+                ai_msg_count += 1
+                last_ai_msg = msg
+        return last_ai_msg, ai_msg_count
+
     def chat(self, user_message: str, stream_callback: Optional[Callable] = None, 
              options: Optional[Dict] = None) -> str:
         """发送消息并获取回复
@@ -30,6 +30,13 @@ class Database:
         if self.conn is None:
             self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
             self.conn.row_factory = sqlite3.Row  # 返回字典格式
+            # WAL 模式 + 放宽同步级别，避免每次 commit 都 fsync（插入密集场景提速明显）
+            self.conn.executescript('''
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA cache_size=-65536;
+            ''')
         return self.conn
     
     def init_database(self):
@@ -547,6 +554,25 @@ class Database:
             logger.error(f"添加下载记录失败: {e}")
             return False
     
+    def bulk_add_download_records(self, rows: List[Tuple]) -> int:
+        """批量添加下载记录（单事务 executemany，供迁移脚本使用）
+
+        rows 每项为 (record_key, model_name, ollama_name, gguf_path,
+        quantization, model_id, download_time, file_exists)
+        """
+        try:
+            conn = self.get_connection()
+            conn.executemany('''
+                INSERT OR REPLACE INTO download_records
+                (record_key, model_name, ollama_name, gguf_path, quantization, model_id, download_time, file_exists)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            conn.commit()
+            return len(rows)
+        except Exception as e:
+            logger.error(f"批量添加下载记录失败: {e}")
+            return 0
+
     def get_download_record(self, record_key: str) -> Optional[Dict]:
         """获取下载记录"""
         try:
@@ -662,6 +688,25 @@ class Database:
             logger.error(f"添加人格失败: {e}")
             return False
     
+    def bulk_add_personas(self, rows: List[Tuple]) -> int:
+        """批量添加人格（单事务 executemany，供迁移脚本使用）
+
+        rows 每项为 (key, name, icon, icon_path, description,
+        system_prompt, type, background_images)
+        """
+        try:
+            conn = self.get_connection()
+            conn.executemany('''
+                INSERT OR REPLACE INTO personas
+                (key, name, icon, icon_path, description, system_prompt, type, background_images)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            conn.commit()
+            return len(rows)
+        except Exception as e:
+            logger.error(f"批量添加人格失败: {e}")
+            return 0
+
     def get_persona(self, key: str) -> Optional[Dict]:
         """获取人格"""
         try:
@@ -894,6 +939,30 @@ class Database:
             logger.error(f"获取个人配置失败: {e}")
             return default
     
+    def get_personal_settings_bulk(self, keys: list) -> Dict:
+        """批量获取个人配置（一次 SELECT，避免逐 key 往返）"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            placeholders = ','.join('?' * len(keys))
+            cursor.execute(
+                f'SELECT key, value FROM personal_settings WHERE key IN ({placeholders})',
+                tuple(keys)
+            )
+            rows = cursor.fetchall()
+
+            settings = {}
+            for row in rows:
+                try:
+                    settings[row['key']] = json.loads(row['value'])
+                except:
+                    settings[row['key']] = row['value']
+            return settings
+        except Exception as e:
+            logger.error(f"批量获取个人配置失败: {e}")
+            return {}
+
     def get_all_personal_settings(self) -> Dict:
         """获取所有个人配置"""
         try:
@@ -1,10 +1,17 @@
+import functools
 import subprocess
 import platform
 import os
 import psutil
 
+@functools.lru_cache(maxsize=1)
 def detect_hardware():
-    """检测硬件信息"""
+    """检测硬件信息
+
+    结果会被缓存：硬件清单运行期间不会变化，而 nvidia-smi 子进程
+    开销很大。热插拔 GPU 等罕见情况可调用 detect_hardware.cache_clear()
+    后重新检测。
+    """
     info = {
         "操作系统": f"{platform.system()} {platform.release()}",
         "处理器": platform.processor(),
@@ -28,9 +28,12 @@ class MediaManager:
         
         # 确保目录存在
         self._ensure_directories()
-        
+
         # 迁移旧的 avatars 目录
         self._migrate_old_avatars()
+
+        # 现有媒体文件的相对路径集合（懒构建，文件增删后失效重扫）
+        self._valid_paths = None
     
     def _ensure_directories(self):
         """确保所有媒体目录存在"""
@@ -80,6 +83,7 @@ class MediaManager:
             
             # 返回相对路径
             relative_path = os.path.relpath(target_path, self.base_dir)
+            self.invalidate_path_cache()
             logger.info(f"用户头像已保存: {relative_path}")
             return relative_path
         except Exception as e:
@@ -120,6 +124,7 @@ class MediaManager:
             
             # 返回相对路径
             relative_path = os.path.relpath(target_path, self.base_dir)
+            self.invalidate_path_cache()
             logger.info(f"助手图标已保存: {relative_path}")
             return relative_path
         except Exception as e:
@@ -155,6 +160,7 @@ class MediaManager:
             
             # 返回相对路径
             relative_path = os.path.relpath(target_path, self.base_dir)
+            self.invalidate_path_cache()
             logger.info(f"背景图片已保存: {relative_path}")
             return relative_path
         except Exception as e:
@@ -213,6 +219,7 @@ class MediaManager:
             absolute_path = self.get_absolute_path(relative_path)
             if os.path.exists(absolute_path):
                 os.remove(absolute_path)
+                self.invalidate_path_cache()
                 logger.info(f"媒体文件已删除: {relative_path}")
                 return True
             return False
@@ -240,11 +247,41 @@ class MediaManager:
                     os.remove(file_path)
                     logger.info(f"已删除助手图标: {filename}")
                     deleted = True
+            if deleted:
+                self.invalidate_path_cache()
             return deleted
         except Exception as e:
             logger.error(f"删除助手文件失败: {e}")
             return False
     
+    def _scan_media_files(self) -> set:
+        """一次 scandir 扫描媒体目录，构建现有文件的相对路径集合"""
+        valid = set()
+        for directory in (self.avatars_dir, self.persona_icons_dir, self.backgrounds_dir):
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            valid.add(os.path.relpath(entry.path, self.base_dir))
+            except OSError:
+                continue
+        return valid
+
+    @property
+    def valid_paths(self) -> set:
+        """
+        现有媒体文件的相对路径集合
+
+        批量校验路径时用集合查找代替逐个 os.path.exists 系统调用。
+        """
+        if self._valid_paths is None:
+            self._valid_paths = self._scan_media_files()
+        return self._valid_paths
+
+    def invalidate_path_cache(self):
+        """媒体文件增删后使路径缓存失效，下次访问时重新扫描"""
+        self._valid_paths = None
+
     def file_exists(self, relative_path: str) -> bool:
         """
         检查文件是否存在
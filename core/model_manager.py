@@ -283,8 +283,12 @@ class ModelManager:
         # 使用小写，保留原始格式确保唯一性
         key = f"{model_name}-{quantization}".lower()
         return key
-    def download_model(self, model_name, progress_callback=None, quantization=None):
-        """从 ModelScope 下载模型，使用自定义进度回调"""
+    def download_model(self, model_name, progress_callback=None, quantization=None, cancel_check=None):
+        """从 ModelScope 下载模型，使用自定义进度回调
+
+        cancel_check: 无参可调用，返回 True 表示调用方请求取消。
+        下载循环协作式检查该标记，避免调用方只能硬终止线程。
+        """
         logger.info(f"========== 开始下载模型 ==========")
         logger.info(f"[下载] 模型名: {model_name}, 量化版本: {quantization}")
         
@@ -341,8 +345,12 @@ class ModelManager:
                 progress_callback(10, f"连接 ModelScope...")
             
             logger.info(f"[下载] 开始从 ModelScope 下载...")
-            gguf_path = self._download_with_progress(model_id, filename, local_dir, progress_callback)
-            
+            gguf_path = self._download_with_progress(model_id, filename, local_dir, progress_callback, cancel_check)
+
+            if cancel_check and cancel_check():
+                logger.info(f"[下载] 下载已取消: {model_name}")
+                return None, None, "下载已取消"
+
             if gguf_path and os.path.exists(gguf_path):
                 file_size = os.path.getsize(gguf_path) / (1024 * 1024)
                 logger.info(f"[下载] 下载成功: {gguf_path} ({file_size:.1f} MB)")
@@ -363,11 +371,11 @@ class ModelManager:
                 logger.info(f"[下载] 检测到符号链接问题，尝试 HTTP 直接下载...")
                 if progress_callback:
                     progress_callback(15, "尝试备用下载方式...")
-                return self._download_http(model_id, filename, model_name, quantization, ollama_name, progress_callback)
+                return self._download_http(model_id, filename, model_name, quantization, ollama_name, progress_callback, cancel_check)
             
             return None, None, f"下载失败: {e}"
     
-    def _download_with_progress(self, model_id, filename, local_dir, progress_callback):
+    def _download_with_progress(self, model_id, filename, local_dir, progress_callback, cancel_check=None):
         """使用 modelscope 下载，并监控进度"""
         import threading
         import time
@@ -404,14 +412,18 @@ class ModelManager:
             finally:
                 result['done'] = True
         
-        # 启动下载线程
-        download_thread = threading.Thread(target=do_download)
+        # 启动下载线程（daemon：取消后不阻塞进程退出，
+        # snapshot_download 本身没有中断接口）
+        download_thread = threading.Thread(target=do_download, daemon=True)
         download_thread.start()
-        
+
         # 监控进度（通过文件大小估算）
         last_size = 0
         check_count = 0
         while not result['done']:
+            if cancel_check and cancel_check():
+                logger.info(f"[下载] 收到取消请求，停止监控: {model_id}")
+                return None
             time.sleep(1)
             check_count += 1
             
@@ -455,7 +467,7 @@ class ModelManager:
                         pass
         return total_size
     
-    def _download_http(self, model_id, filename, model_name, quantization, ollama_name, progress_callback=None):
+    def _download_http(self, model_id, filename, model_name, quantization, ollama_name, progress_callback=None, cancel_check=None):
         """HTTP 直接下载（带进度）"""
         try:
             import requests
@@ -484,9 +496,13 @@ class ModelManager:
             downloaded = 0
             
             temp_path = target_path + ".tmp"
-            
+            cancelled = False
+
             with open(temp_path, 'wb') as f:
                 for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    if cancel_check and cancel_check():
+                        cancelled = True
+                        break
                     if chunk:
                         f.write(chunk)
                         downloaded += len(chunk)
@@ -496,8 +512,17 @@ class ModelManager:
                             total_mb = total_size / (1024 * 1024)
                             progress_callback(percent, f"下载中: {downloaded_mb:.1f}/{total_mb:.1f} MB ({percent}%)")
             
+            if cancelled:
+                logger.info(f"[下载] HTTP 下载已取消，清理临时文件: {temp_path}")
+                response.close()
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                return None, None, "下载已取消"
+
             os.rename(temp_path, target_path)
-            
+
             self.add_download_record(model_name, ollama_name, target_path, quantization, model_id)
             
             if progress_callback:
@@ -23,6 +23,13 @@ class OllamaManager:
         
         # PID 文件路径，用于追踪启动的进程
         self.pid_file = os.path.join(self.base_dir, ".ollama_pid")
+
+        # 短 TTL 缓存：同一个事件处理里经常连续探测状态/列模型，
+        # 每次都打一轮 HTTP 没有意义；模型增删后主动失效
+        self._running_cache = None
+        self._running_cache_at = 0.0
+        self._models_cache = None
+        self._models_cache_at = 0.0
         
         # 启动时清理上次可能残留的进程
         self._cleanup_stale_process()
@@ -113,12 +120,23 @@ class OllamaManager:
         return self.ollama_path is not None
     
     def is_running(self):
-        """检查 Ollama 服务是否运行"""
+        """检查 Ollama 服务是否运行（1 秒内的重复探测直接用缓存）"""
+        now = time.monotonic()
+        if self._running_cache is not None and now - self._running_cache_at < 1.0:
+            return self._running_cache
         try:
             response = requests.get(f"{self.base_url}/api/tags", timeout=3)
-            return response.status_code == 200
+            running = response.status_code == 200
         except:
-            return False
+            running = False
+        self._running_cache = running
+        self._running_cache_at = now
+        return running
+
+    def invalidate_cache(self):
+        """状态或模型集合可能已变化，清掉短 TTL 缓存"""
+        self._running_cache = None
+        self._models_cache = None
     
     def start_service(self):
         """启动 Ollama 服务"""
@@ -146,6 +164,7 @@ class OllamaManager:
             self._save_pid(self.process.pid)
             
             for i in range(30):
+                self.invalidate_cache()
                 if self.is_running():
                     return True, "服务启动成功"
                 time.sleep(1)
@@ -181,11 +200,15 @@ class OllamaManager:
             finally:
                 self.process = None
                 self._remove_pid_file()
+                self.invalidate_cache()
             return True
         return False
     
     def list_models(self):
-        """获取已安装的模型列表"""
+        """获取已安装的模型列表（3 秒内的重复调用返回缓存）"""
+        now = time.monotonic()
+        if self._models_cache is not None and now - self._models_cache_at < 3.0:
+            return self._models_cache
         try:
             response = requests.get(f"{self.base_url}/api/tags", timeout=10)
             if response.status_code == 200:
@@ -199,6 +222,8 @@ class OllamaManager:
                         "size": f"{size_gb:.2f} GB",
                         "modified": m.get("modified_at", "")
                     })
+                self._models_cache = models
+                self._models_cache_at = now
                 return models
         except:
             pass
@@ -215,6 +240,7 @@ class OllamaManager:
             )
             success = response.status_code == 200
             if success:
+                self.invalidate_cache()
                 logger.info(f"Ollama 模型删除成功: {model_name}")
             else:
                 logger.warning(f"Ollama 模型删除失败: {model_name}, 状态码: {response.status_code}")
@@ -338,6 +364,7 @@ PARAMETER top_p 0.9
                     progress_callback(f"已清理 Modelfile: {modelfile_path}")
             
             if process.returncode == 0:
+                self.invalidate_cache()
                 if progress_callback:
                     progress_callback("✅ 模型创建成功!")
                 return True
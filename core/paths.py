@@ -0,0 +1,46 @@
+"""路径解析工具
+
+打包（PyInstaller frozen/_MEIPASS）与开发环境的路径分支集中在这里，
+结果用 lru_cache 缓存：这些状态进程运行期间不会变化，没必要每次
+重新 stat 文件系统。
+"""
+
+import functools
+import os
+import sys
+
+
+@functools.lru_cache(maxsize=None)
+def get_base_dir() -> str:
+    """应用基础目录（打包后为 exe 所在目录，开发环境为项目根目录）"""
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@functools.lru_cache(maxsize=None)
+def get_icon_path() -> str:
+    """解析应用图标路径，找不到文件时返回空字符串
+
+    打包后优先从 _MEIPASS（PyInstaller 解压的临时目录）获取，
+    其次 exe 同级目录；开发环境用项目根目录。
+    """
+    if getattr(sys, 'frozen', False):
+        meipass = getattr(sys, '_MEIPASS', None)
+        if meipass:
+            icon_path = os.path.join(meipass, "icon.ico")
+            if os.path.exists(icon_path):
+                return icon_path
+        icon_path = os.path.join(os.path.dirname(sys.executable), "icon.ico")
+    else:
+        icon_path = os.path.join(get_base_dir(), "icon.ico")
+
+    return icon_path if os.path.exists(icon_path) else ""
+
+
+# 模块级常量：导入时解析一次，热路径直接引用，不再做 frozen 分支和 stat
+IS_FROZEN = bool(getattr(sys, 'frozen', False))
+MEIPASS_DIR = getattr(sys, '_MEIPASS', None)
+BASE_DIR = get_base_dir()
+ICON_PATH = get_icon_path()
+PERSONAL_SETTINGS_PATH = os.path.join(BASE_DIR, 'personal_settings.json')
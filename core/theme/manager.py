@@ -37,6 +37,10 @@ class ThemeManager(QObject):
         
         self._current_theme = None
         self._themes = {}  # 已注册的主题
+        # colors/current 属性的扁平化结果缓存：绘制路径每次取色都会访问
+        # 这两个属性，扁平化映射没必要重复执行，主题切换时失效
+        self._flat_colors = None
+        self._compat_current = None
         
         # 加载内置主题
         self._load_builtin_themes()
@@ -71,6 +75,7 @@ class ThemeManager(QObject):
         else:
             # 如果配置的主题不存在，使用默认主题
             self._current_theme = self._themes.get('dark')
+        self._invalidate_compat_cache()
     
     def _get_config_path(self) -> str:
         """获取配置文件路径"""
@@ -104,37 +109,45 @@ class ThemeManager(QObject):
         except Exception as e:
             print(f"保存主题配置失败: {e}")
     
+    def _invalidate_compat_cache(self):
+        """当前主题变化后使扁平化缓存失效"""
+        self._flat_colors = None
+        self._compat_current = None
+
     @property
     def current(self) -> Dict[str, Any]:
-        """获取当前主题完整数据（兼容旧代码）"""
+        """获取当前主题完整数据（兼容旧代码，结果按主题缓存）"""
         if not self._current_theme:
             return {}
-        
-        # 返回兼容旧代码的扁平结构
-        meta = self._current_theme.get('meta', {})
-        colors = self._current_theme.get('colors', {})
-        
-        # 创建兼容的主题字典
-        compat_theme = {
-            'name': meta.get('name', 'dark'),
-            'display_name': meta.get('display_name', '深色'),
-        }
-        
-        # 添加扁平化的颜色
-        compat_theme.update(self._flatten_colors(colors))
-        
-        return compat_theme
-    
+
+        if self._compat_current is None:
+            # 返回兼容旧代码的扁平结构
+            meta = self._current_theme.get('meta', {})
+            colors = self._current_theme.get('colors', {})
+
+            # 创建兼容的主题字典
+            compat_theme = {
+                'name': meta.get('name', 'dark'),
+                'display_name': meta.get('display_name', '深色'),
+            }
+
+            # 添加扁平化的颜色
+            compat_theme.update(self.colors)
+            self._compat_current = compat_theme
+
+        return self._compat_current
+
     @property
     def colors(self) -> Dict[str, Any]:
-        """获取当前主题颜色配置（兼容旧代码）"""
+        """获取当前主题颜色配置（兼容旧代码，结果按主题缓存）"""
         if not self._current_theme:
             return {}
-        
-        # 扁平化颜色配置，兼容旧的访问方式
-        colors = self._current_theme.get('colors', {})
-        flat_colors = self._flatten_colors(colors)
-        return flat_colors
+
+        if self._flat_colors is None:
+            # 扁平化颜色配置，兼容旧的访问方式
+            colors = self._current_theme.get('colors', {})
+            self._flat_colors = self._flatten_colors(colors)
+        return self._flat_colors
     
     def _flatten_colors(self, colors: Dict[str, Any], prefix: str = '') -> Dict[str, str]:
         """扁平化颜色配置
@@ -233,6 +246,7 @@ class ThemeManager(QObject):
         # 如果主题已注册，直接使用
         if theme_name in self._themes:
             self._current_theme = self._themes[theme_name]
+            self._invalidate_compat_cache()
             self._save_config()
             logger.info(f"发射 theme_changed 信号，主题: {theme_name}")
             self.theme_changed.emit(self._current_theme)
@@ -244,6 +258,7 @@ class ThemeManager(QObject):
         if theme_data:
             self._themes[theme_name] = theme_data
             self._current_theme = theme_data
+            self._invalidate_compat_cache()
             self._save_config()
             logger.info(f"发射 theme_changed 信号，主题: {theme_name}")
             self.theme_changed.emit(self._current_theme)
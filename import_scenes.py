@@ -6,9 +6,32 @@
 """
 
 import json
+import mmap
 import sys
 import os
 
+# 可选加速：orjson 可直接解析 mmap 缓冲区（零拷贝）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 可选加速：模块级预编译场景校验器，坏数据走快速跳过而不是抛异常
+try:
+    from jsonschema import Draft7Validator
+
+    _SCENE_VALIDATOR = Draft7Validator({
+        "type": "object",
+        "properties": {
+            "scene": {"type": "string"},
+            "time": {"type": "string"},
+            "opening": {"type": "string"},
+            "recommendations": {"type": "object"},
+        },
+    })
+except ImportError:
+    _SCENE_VALIDATOR = None
+
 # 添加项目根目录到路径
 if getattr(sys, 'frozen', False):
     base_dir = os.path.dirname(sys.executable)
@@ -19,6 +42,20 @@ sys.path.insert(0, base_dir)
 from core.database import get_database
 
 
+# add_persona 参数默认值（一次合并字典，避免逐字段 .get() 查找）
+PERSONA_DEFAULTS = {
+    "name": "",
+    "icon": "🎭",
+    "icon_path": "",
+    "description": "",
+    "system_prompt": "",
+    "background_images": "",
+    "enable_suggestions": True,
+    "gender": "",
+    "user_identity": "",
+}
+
+
 # 时间段映射
 TIME_MAPPING = {
     "凌晨": "midnight",
@@ -31,6 +68,32 @@ TIME_MAPPING = {
     "夜晚": "night",
     "任意": "any",
 }
+# intern 时间段值：批量导入时返回字典共享同一批字符串对象，
+# 下游字典比较可走指针相等
+TIME_MAPPING = {k: sys.intern(v) for k, v in TIME_MAPPING.items()}
+
+
+def load_scene_file(json_file: str):
+    """读取场景 JSON 文件
+
+    多 MB 的场景文件用 mmap 做零拷贝读取（配合 orjson 直接解析缓冲区），
+    没有 orjson 时回退到标准库 json。
+    """
+    if orjson is not None:
+        with open(json_file, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    mv = memoryview(mm)
+                    try:
+                        return orjson.loads(mv)
+                    finally:
+                        mv.release()
+            except (ValueError, OSError):
+                # 空文件等 mmap 失败时回退到整读
+                f.seek(0)
+                return orjson.loads(f.read())
+    with open(json_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
 
 def parse_time_period(time_str: str) -> str:
@@ -111,8 +174,7 @@ def import_scenes(persona_key: str, json_file: str, replace: bool = False):
     
     # 读取 JSON 文件
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            scenes_data = json.load(f)
+        scenes_data = load_scene_file(json_file)
     except FileNotFoundError:
         print(f"❌ 文件不存在: {json_file}")
         return False
@@ -124,15 +186,22 @@ def import_scenes(persona_key: str, json_file: str, replace: bool = False):
         print("❌ JSON 格式错误，应为数组")
         return False
     
-    # 转换场景数据
+    # 转换场景数据（逐条 print 会触发逐行 flush，先收集再一次性输出）
     new_scenes = []
+    msgs = []
     for i, scene_data in enumerate(scenes_data):
+        if _SCENE_VALIDATOR is not None and not _SCENE_VALIDATOR.is_valid(scene_data):
+            msgs.append(f"  ✗ 场景 {i+1} 格式不符，跳过")
+            continue
         try:
             converted = convert_scene(scene_data)
             new_scenes.append(converted)
-            print(f"  ✓ 场景 {i+1}: {scene_data.get('scene', '未命名')} ({scene_data.get('time', '任意时间')})")
+            msgs.append(f"  ✓ 场景 {i+1}: {scene_data.get('scene', '未命名')} ({scene_data.get('time', '任意时间')})")
         except Exception as e:
-            print(f"  ✗ 场景 {i+1} 转换失败: {e}")
+            msgs.append(f"  ✗ 场景 {i+1} 转换失败: {e}")
+    if msgs:
+        sys.stdout.write("\n".join(msgs) + "\n")
+        sys.stdout.flush()
     
     if not new_scenes:
         print("❌ 没有有效的场景数据")
@@ -152,19 +221,12 @@ def import_scenes(persona_key: str, json_file: str, replace: bool = False):
         print(f"\n📝 追加模式：原有 {len(existing_scenes)} 个，新增 {len(new_scenes)} 个，共 {len(final_scenes)} 个")
     
     # 更新数据库
+    fields = {**PERSONA_DEFAULTS, **{k: v for k, v in persona.items() if k in PERSONA_DEFAULTS}}
     success = db.add_persona(
         key=persona_key,
-        name=persona.get("name", ""),
-        icon=persona.get("icon", "🎭"),
-        icon_path=persona.get("icon_path", ""),
-        description=persona.get("description", ""),
-        system_prompt=persona.get("system_prompt", ""),
         persona_type="roleplay",
-        background_images=persona.get("background_images", ""),
         scene_designs=final_scenes,
-        enable_suggestions=persona.get("enable_suggestions", True),
-        gender=persona.get("gender", ""),
-        user_identity=persona.get("user_identity", "")
+        **fields
     )
     
     if success:
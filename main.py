@@ -25,33 +25,51 @@ logger = get_logger('main')
 
 try:
     logger.info("应用启动开始")
-    
+
     # 更新启动画面
     if pyi_splash:
         pyi_splash.update_text('正在加载配置...')
-    
+
+    # 标记文件统一锚定到应用基础目录：初始化器写的就是
+    # base_dir/.initialized，相对 CWD 判断在打包后随启动目录漂移
+    from core.paths import BASE_DIR
+    init_flag = os.path.join(BASE_DIR, '.initialized')
+    migrate_flag = os.path.join(BASE_DIR, '.migrated')
+
     # 首次启动时自动初始化（导入模型和人格配置）
-    logger.info("开始执行初始化检查...")
-    from core.initialization import auto_initialize_on_startup
-    auto_initialize_on_startup()
-    
+    # 标记文件存在时跳过导入，避免冷启动时加载整个初始化模块
+    if not os.path.exists(init_flag):
+        logger.info("开始执行初始化检查...")
+        from core.initialization import auto_initialize_on_startup
+        auto_initialize_on_startup()
+    else:
+        logger.info("应用已初始化，跳过初始化检查")
+
     # 首次启动时自动迁移数据（从旧的 JSON 格式）
-    logger.info("开始执行数据迁移检查...")
-    from core.migration import auto_migrate_on_startup
-    auto_migrate_on_startup()
-    
+    # 同样用标记文件避免每次启动都导入迁移模块
+    if not os.path.exists(migrate_flag):
+        logger.info("开始执行数据迁移检查...")
+        from core.migration import auto_migrate_on_startup
+        success, _ = auto_migrate_on_startup()
+        if success:
+            with open(migrate_flag, 'w', encoding='utf-8') as f:
+                f.write('')
+    else:
+        logger.info("数据已迁移，跳过迁移检查")
+
     # 更新启动画面
     if pyi_splash:
         pyi_splash.update_text('正在启动应用...')
-    
-    logger.info("开始加载主界面...")
-    from ui.app import main
-    
+
     if __name__ == "__main__":
+        # 主界面（及 PySide6）推迟到真正需要时再导入
+        logger.info("开始加载主界面...")
+        from ui.app import main
+
         # 关闭启动画面
         if pyi_splash:
             pyi_splash.close()
-        
+
         logger.info("进入主程序")
         main()
 
@@ -5,85 +5,122 @@
 """
 
 import json
+import mmap
 import os
 import sys
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from core.database import get_database
 
-def migrate_models():
+# 可选加速：simdjson 解析器构造成本高，模块级复用一个实例
+try:
+    import simdjson
+
+    _json_parser = simdjson.Parser()
+    _parser_lock = threading.Lock()  # 解析器一次只能持有一个文档
+
+    def load_json_file(path):
+        """读取 JSON 文件（复用 simdjson 解析器，大文件 mmap 零拷贝）"""
+        with open(path, 'rb') as f:
+            try:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                buf = f.read()  # 空文件等 mmap 失败时回退到整读
+            try:
+                with _parser_lock:
+                    doc = _json_parser.parse(buf)
+                    result = doc.as_dict() if hasattr(doc, 'as_dict') else doc.as_list()
+                    del doc
+                return result
+            finally:
+                if isinstance(buf, mmap.mmap):
+                    buf.close()
+
+except ImportError:
+    def load_json_file(path):
+        """读取 JSON 文件（标准库回退）"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+# add_persona 参数默认值（一次合并字典，避免逐字段 .get() 查找）
+PERSONA_DEFAULTS = {
+    'name': '',
+    'icon': '🤖',
+    'icon_path': '',
+    'description': '',
+    'system_prompt': '',
+    'persona_type': 'assistant',
+    'background_images': '',
+}
+
+def migrate_models(present):
     """迁移模型配置"""
     print("开始迁移模型配置...")
     
-    if not os.path.exists('models.json'):
+    if 'models.json' not in present:
         print("⚠️ models.json 不存在，跳过")
         return
     
-    with open('models.json', 'r', encoding='utf-8') as f:
-        models_data = json.load(f)
+    models_data = load_json_file('models.json')
     
     db = get_database()
-    count = 0
-    
-    for category, subcategories in models_data.items():
-        for subcategory, models in subcategories.items():
-            for model in models:
-                success = db.add_model(
-                    model_id=model['id'],
-                    category=category,
-                    subcategory=subcategory,
-                    name=model['name'],
-                    params=model['params'],
-                    params_b=model['params_b'],
-                    ctx=model['ctx'],
-                    lang=model['lang'],
-                    distilled=model['distilled'],
-                    quantizations=model['quantizations'],
-                    file_pattern=model['file_pattern']
-                )
-                if success:
-                    count += 1
-    
-    print(f"✅ 成功迁移 {count} 个模型配置")
-
-def migrate_personas():
+    conn = db.get_connection()
+
+    # 先构建参数列表，一次 executemany 写入，避免每行一次方法调用 + commit
+    rows = [
+        (model['id'], category, subcategory, model['name'], model['params'],
+         model['params_b'], model['ctx'], json.dumps(model['lang']),
+         1 if model['distilled'] else 0, json.dumps(model['quantizations']),
+         model['file_pattern'])
+        for category, subcategories in models_data.items()
+        for subcategory, models in subcategories.items()
+        for model in models
+    ]
+
+    conn.executemany('''
+        INSERT OR REPLACE INTO models
+        (id, category, subcategory, name, params, params_b, ctx, lang, distilled, quantizations, file_pattern)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
+    conn.commit()
+
+    print(f"✅ 成功迁移 {len(rows)} 个模型配置")
+
+def migrate_personas(present):
     """迁移助手配置"""
     print("开始迁移助手配置...")
     
-    if not os.path.exists('personas.json'):
+    if 'personas.json' not in present:
         print("⚠️ personas.json 不存在，跳过")
         return
     
-    with open('personas.json', 'r', encoding='utf-8') as f:
-        personas_data = json.load(f)
+    personas_data = load_json_file('personas.json')
     
     db = get_database()
-    count = 0
-    
+
+    # 构建参数行后单事务批量写入
+    rows = []
     for key, persona in personas_data.items():
-        success = db.add_persona(
-            key=key,
-            name=persona.get('name', ''),
-            icon=persona.get('icon', '🤖'),
-            icon_path=persona.get('icon_path', ''),
-            description=persona.get('description', ''),
-            system_prompt=persona.get('system_prompt', ''),
-            persona_type=persona.get('type', 'assistant'),
-            background_images=persona.get('background_images', '')
-        )
-        if success:
-            count += 1
-    
+        fields = {**PERSONA_DEFAULTS, **{k: v for k, v in persona.items() if k in PERSONA_DEFAULTS}}
+        if 'type' in persona:
+            fields['persona_type'] = persona['type']
+        rows.append((key, fields['name'], fields['icon'], fields['icon_path'],
+                     fields['description'], fields['system_prompt'],
+                     fields['persona_type'], fields['background_images']))
+    count = db.bulk_add_personas(rows)
+
     print(f"✅ 成功迁移 {count} 个助手配置")
 
-def migrate_personal_settings():
+def migrate_personal_settings(present):
     """迁移个人设置"""
     print("开始迁移个人设置...")
     
-    if not os.path.exists('personal_settings.json'):
+    if 'personal_settings.json' not in present:
         print("⚠️ personal_settings.json 不存在，跳过")
         return
     
-    with open('personal_settings.json', 'r', encoding='utf-8') as f:
-        settings_data = json.load(f)
+    settings_data = load_json_file('personal_settings.json')
     
     db = get_database()
     count = 0
@@ -95,47 +132,43 @@ def migrate_personal_settings():
     
     print(f"✅ 成功迁移 {count} 个个人设置")
 
-def migrate_download_records():
+def migrate_download_records(present):
     """迁移下载记录"""
     print("开始迁移下载记录...")
     
-    if not os.path.exists('download_records.json'):
+    if 'download_records.json' not in present:
         print("⚠️ download_records.json 不存在，跳过")
         return
     
-    with open('download_records.json', 'r', encoding='utf-8') as f:
-        records_data = json.load(f)
+    records_data = load_json_file('download_records.json')
     
     db = get_database()
-    count = 0
-    
-    for record_key, record in records_data.items():
-        success = db.add_download_record(
-            record_key=record_key,
-            model_name=record.get('model_name', ''),
-            ollama_name=record.get('ollama_name', ''),
-            gguf_path=record.get('gguf_path', ''),
-            quantization=record.get('quantization', ''),
-            model_id=record.get('model_id', '')
-        )
-        if success:
-            count += 1
-    
+
+    # 构建参数行后单事务批量写入
+    now = datetime.now().isoformat()
+    rows = [
+        (record_key, record.get('model_name', ''), record.get('ollama_name', ''),
+         record.get('gguf_path', ''), record.get('quantization', ''),
+         record.get('model_id', ''), now,
+         1 if os.path.exists(record.get('gguf_path', '')) else 0)
+        for record_key, record in records_data.items()
+    ]
+    count = db.bulk_add_download_records(rows)
+
     print(f"✅ 成功迁移 {count} 个下载记录")
 
-def backup_json_files():
+def backup_json_files(present):
     """备份 JSON 文件"""
     print("备份原始 JSON 文件...")
-    
+
     backup_dir = 'json_backup'
-    if not os.path.exists(backup_dir):
-        os.makedirs(backup_dir)
-    
+    os.makedirs(backup_dir, exist_ok=True)
+
     files = ['models.json', 'personas.json', 'personal_settings.json', 'download_records.json']
     count = 0
-    
+
     for filename in files:
-        if os.path.exists(filename):
+        if filename in present:
             backup_path = os.path.join(backup_dir, filename)
             with open(filename, 'r', encoding='utf-8') as src:
                 with open(backup_path, 'w', encoding='utf-8') as dst:
@@ -151,15 +184,23 @@ def main():
     print("=" * 60)
     print()
     
+    # 一次 scandir 得到当前目录文件集合，避免各阶段反复 stat
+    present = {entry.name for entry in os.scandir('.') if entry.is_file()}
+
     # 备份原始文件
-    backup_json_files()
+    backup_json_files(present)
     print()
-    
-    # 执行迁移
-    migrate_models()
-    migrate_personas()
-    migrate_personal_settings()
-    migrate_download_records()
+
+    # 迁移期间关闭同步（JSON 备份仍在，脚本可重跑，安全）
+    db = get_database()
+    db.get_connection().execute('PRAGMA synchronous=OFF')
+    
+    # 并行执行迁移（各阶段写入互不相交的表，JSON 解析与数据库 I/O 可重叠）
+    phases = [migrate_models, migrate_personas, migrate_personal_settings, migrate_download_records]
+    with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+        futures = [executor.submit(phase, present) for phase in phases]
+        for future in futures:
+            future.result()
     
     print()
     print("=" * 60)
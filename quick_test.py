@@ -9,7 +9,8 @@ logger = get_logger('test')
 
 app = QApplication.instance() or QApplication(sys.argv)
 window = MainWindow()
-window.show()
+# 推迟到事件循环第一帧再 show，让 Qt 合并初始布局，减少启动期重绘
+QTimer.singleShot(0, window.show)
 
 logger.info("=" * 60)
 logger.info("快速测试 - 请切换主题并观察日志输出")
@@ -3,15 +3,21 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QFrame, QScrollArea,
-    QStackedWidget, QMessageBox
+    QStackedWidget, QMessageBox, QListView, QDialog, QMenu
 )
-from PySide6.QtCore import Qt, Signal, Slot, QThread, QTimer
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QRunnable, QThreadPool, QTimer, QUrl, QModelIndex, QPoint
 from PySide6.QtGui import QFont, QIcon
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
 import sys
 import os
 import json
+import re
+import shutil
+import signal
+import time
 from datetime import datetime
+from pathlib import Path
 import logging
 logger = logging.getLogger(__name__)
 if getattr(sys, 'frozen', False):
@@ -21,36 +27,110 @@ else:
 sys.path.insert(0, BASE_DIR)
 
 from core.hardware import detect_hardware
+from core.paths import get_icon_path, PERSONAL_SETTINGS_PATH
 from core.ollama_manager import OllamaManager
 from core.model_manager import ModelManager
 from core.chat_db import ChatManager
+from core.media_manager import get_media_manager
+
+# 可选：PySide6 6.6+ 提供 QtAsyncio，把 Qt 事件循环与 asyncio 合并，
+# I/O 型回调可以用协程 await 而不用每次走线程 + 信号中转
+try:
+    import asyncio
+    import PySide6.QtAsyncio as QtAsyncio
+except ImportError:
+    QtAsyncio = None
 
 from .themes import get_theme_manager, get_stylesheet
-from .components import HistoryItem
+
+# 常用字体常量：QFont 构造要查字体数据库，模块导入时构建一次全局复用
+_FONT_BTN = QFont("Microsoft YaHei UI", 13, QFont.Bold)
+_FONT_LABEL_11 = QFont("Microsoft YaHei UI", 11)
+_FONT_LABEL_10 = QFont("Microsoft YaHei UI", 10)
+_FONT_LABEL_12 = QFont("Microsoft YaHei UI", 12)
+_FONT_BTN_BOLD_11 = QFont("Microsoft YaHei UI", 11, QFont.Bold)
+_FONT_BTN_BOLD_12 = QFont("Microsoft YaHei UI", 12, QFont.Bold)
+_FONT_TITLE_15 = QFont("Microsoft YaHei UI", 15, QFont.Bold)
+_FONT_TITLE_16 = QFont("Microsoft YaHei UI", 16, QFont.Bold)
+_FONT_EMOJI_28 = QFont("Segoe UI Emoji", 28)
+_FONT_EMOJI_32 = QFont("Segoe UI Emoji", 32)
+
+# 模型名归一化：去掉 - 和 . 再比较（str.translate 比链式 replace 快）
+_MODEL_NORM_TBL = str.maketrans('', '', '-.')
+
+# 通知栏常量：每条通知都会走 set_notification，小字典和 emoji 列表
+# 没必要每次重建；emoji 检测合并成一次正则扫描
+_NOTIF_EMOJIS = ("✅", "❌", "⚠️", "ℹ️", "🚀", "📥", "📊")
+_NOTIF_EMOJI_RE = re.compile("|".join(map(re.escape, _NOTIF_EMOJIS)))
+_NOTIF_COLOR_KEYS = {
+    "info": "text_secondary",
+    "success": "success",
+    "warning": "warning",
+    "error": "error",
+}
+_NOTIF_ICONS = {
+    "info": "ℹ️",
+    "success": "✅",
+    "warning": "⚠️",
+    "error": "❌",
+}
+from .components import ChatHistoryModel, HistoryItemDelegate
 from .chat_page import ChatPage
 from .settings_page import SettingsPage
 
 
-class WorkerThread(QThread):
-    """工作线程"""
+class WorkerSignals(QObject):
+    """工作任务信号载体（QRunnable 本身不能携带信号）"""
     finished = Signal(object)
     progress = Signal(str, int, str)  # model_name, percent, text
-    
+
+
+class WorkerThread(QRunnable):
+    """工作任务：提交到共享线程池执行，避免每次操作都新建/销毁线程"""
+
+    _pool = None
+    # 在飞任务登记表：持有 Python 引用，防止 self.worker 被覆盖后
+    # 运行中的 runnable 被回收
+    _active = set()
+
+    @classmethod
+    def pool(cls) -> QThreadPool:
+        """共享线程池（懒初始化）"""
+        if cls._pool is None:
+            cls._pool = QThreadPool.globalInstance()
+            cls._pool.setMaxThreadCount(min(32, (os.cpu_count() or 4) * 2))
+        return cls._pool
+
     def __init__(self, func, *args, **kwargs):
         super().__init__()
+        # 池不负责销毁，由 Python 引用管理生命周期
+        self.setAutoDelete(False)
+        self.signals = WorkerSignals()
+        self.finished = self.signals.finished
+        self.progress = self.signals.progress
         self.func = func
         self.args = args
         self.kwargs = kwargs
         self._is_cancelled = False
-    
+        self._running = False
+
     def cancel(self):
-        """标记线程为取消状态"""
+        """标记任务为取消状态"""
         self._is_cancelled = True
-    
+
     @property
     def is_cancelled(self):
         return self._is_cancelled
-    
+
+    def isRunning(self) -> bool:
+        return self._running
+
+    def start(self):
+        """提交到共享线程池"""
+        self._running = True
+        WorkerThread._active.add(self)
+        self.pool().start(self)
+
     def run(self):
         try:
             if not self._is_cancelled:
@@ -60,11 +140,169 @@ class WorkerThread(QThread):
         except Exception as e:
             if not self._is_cancelled:
                 self.finished.emit(e)
+        finally:
+            self._running = False
+            WorkerThread._active.discard(self)
+
+
+class _ConfirmDialog(QDialog):
+    """可复用的确认弹窗
+
+    构建一次反复使用：每次确认不再重建布局/按钮，也不再重新解析 QSS
+    （样式只在主题或危险态变化时重算）。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.theme = get_theme_manager()
+        self._styled_key = None  # (主题名, 是否危险态)，避免重复 setStyleSheet
+        self._qss_cache = {}  # 主题名 -> 各部件样式串，切换危险态时直接复用
+
+        self.setFixedWidth(420)
+        self.setModal(True)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(30, 25, 30, 25)
+        layout.setSpacing(18)
+
+        # 图标和标题
+        title_layout = QHBoxLayout()
+        title_layout.setSpacing(12)
+
+        self.icon_label = QLabel("⚠️")
+        self.icon_label.setFont(_FONT_EMOJI_28)
+        title_layout.addWidget(self.icon_label)
+
+        self.title_label = QLabel("")
+        self.title_label.setFont(_FONT_TITLE_15)
+        title_layout.addWidget(self.title_label, 1)
+
+        layout.addLayout(title_layout)
+
+        # 提示信息
+        self.msg_label = QLabel("")
+        self.msg_label.setFont(_FONT_LABEL_11)
+        self.msg_label.setWordWrap(True)
+        layout.addWidget(self.msg_label)
+
+        # 按钮
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(12)
+        button_layout.addStretch()
+
+        self.cancel_btn = QPushButton("取消")
+        self.cancel_btn.setFixedSize(100, 38)
+        self.cancel_btn.setCursor(Qt.PointingHandCursor)
+        self.cancel_btn.setFont(_FONT_LABEL_11)
+        self.cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(self.cancel_btn)
+
+        self.confirm_btn = QPushButton("确定")
+        self.confirm_btn.setFixedSize(100, 38)
+        self.confirm_btn.setCursor(Qt.PointingHandCursor)
+        self.confirm_btn.setFont(_FONT_BTN_BOLD_11)
+        self.confirm_btn.clicked.connect(self.accept)
+        button_layout.addWidget(self.confirm_btn)
+
+        layout.addLayout(button_layout)
+
+    def _build_qss(self) -> dict:
+        """按当前主题一次性生成所有样式串（每个主题只拼一次 f-string）"""
+        c = self.theme.colors
+        return {
+            'dialog': f"""
+                QDialog {{
+                    background-color: {c['bg']};
+                    border-radius: 12px;
+                }}
+            """,
+            'title': f"color: {c['text']};",
+            'msg': f"color: {c['text_secondary']}; line-height: 1.5;",
+            'cancel': f"""
+                QPushButton {{
+                    background-color: {c['bg_tertiary']};
+                    color: {c['text']};
+                    border: 2px solid {c['border']};
+                    border-radius: 10px;
+                    font-weight: 500;
+                }}
+                QPushButton:hover {{
+                    background-color: {c['hover']};
+                    border-color: {c['text_dim']};
+                }}
+            """,
+            'danger': f"""
+                QPushButton {{
+                    background-color: {c['error']};
+                    color: white;
+                    border: none;
+                    border-radius: 10px;
+                    font-weight: 600;
+                }}
+                QPushButton:hover {{
+                    background-color: #c82333;
+                }}
+            """,
+            'accent': f"""
+                QPushButton {{
+                    background-color: {c['accent']};
+                    color: white;
+                    border: none;
+                    border-radius: 10px;
+                    font-weight: 600;
+                }}
+                QPushButton:hover {{
+                    background-color: {c['accent_hover']};
+                }}
+            """,
+        }
+
+    def _apply_style(self, confirm_danger: bool):
+        """按当前主题和危险态刷新样式（未变化时直接返回）"""
+        theme_name = self.theme.current.get('name')
+        key = (theme_name, confirm_danger)
+        if key == self._styled_key:
+            return
+        self._styled_key = key
+
+        qss = self._qss_cache.get(theme_name)
+        if qss is None:
+            qss = self._qss_cache[theme_name] = self._build_qss()
+
+        self.setStyleSheet(qss['dialog'])
+        self.title_label.setStyleSheet(qss['title'])
+        self.msg_label.setStyleSheet(qss['msg'])
+        self.cancel_btn.setStyleSheet(qss['cancel'])
+        self.confirm_btn.setStyleSheet(qss['danger'] if confirm_danger else qss['accent'])
+
+    def ask(self, title: str, message: str, icon: str = "⚠️",
+            confirm_text: str = "确定", cancel_text: str = "取消",
+            confirm_danger: bool = False) -> bool:
+        """设置文案并模态显示，返回用户是否点击确认"""
+        self.setWindowTitle(title)
+        self.icon_label.setText(icon)
+        self.title_label.setText(title)
+        self.msg_label.setText(message)
+        self.confirm_btn.setText(confirm_text)
+        self.cancel_btn.setText(cancel_text)
+        self._apply_style(confirm_danger)
+        return self.exec() == QDialog.Accepted
 
 
 class MainWindow(QMainWindow):
     """主窗口"""
-    
+
+    # 应用图标类级缓存：.ico 只从磁盘加载一次，后续窗口复用像素缓存
+    _app_icon = None
+
+    @classmethod
+    def app_icon(cls) -> QIcon:
+        """应用图标（懒加载，找不到图标文件时返回空 QIcon）"""
+        if cls._app_icon is None:
+            icon_path = get_icon_path()
+            cls._app_icon = QIcon(icon_path) if icon_path else QIcon()
+        return cls._app_icon
+
     def __init__(self):
         super().__init__()
         
@@ -74,13 +312,52 @@ class MainWindow(QMainWindow):
         self.chat_manager = ChatManager()
         
         self.current_chat_id = None
-        self.current_history_item = None
         self.worker = None
+        self._download_worker = None  # 下载专用任务（self.worker 会被状态检查等复用）
         self.chat_worker = None  # 聊天专用线程
         self.suggestion_worker = None  # 推荐生成线程
         self._stop_requested = False  # 停止生成标志
         self.current_download_model = None
-        
+        self._qnam = QNetworkAccessManager(self)  # 异步状态探测
+        self._current_qss = None  # 当前全窗口样式串（缓存对象，用于跳过重复 polish）
+        self._bg_cache_mtime = None  # personal_settings.json 的 mtime 缓存
+        self._bg_cache_data = ([], 5)  # (背景列表, 轮播间隔)
+        self._confirm_dialog = _ConfirmDialog(self)  # 复用的确认弹窗
+        self._uninstall_dialog = None  # 卸载确认弹窗，首次使用时构建并复用
+        self.media_manager = get_media_manager()  # 媒体管理单例
+        self._models_cache = []  # 已安装模型缓存，启动/安装/卸载时刷新
+        self._bg_parse_cache = {}  # background_images 原始串 -> 解析结果
+        self._bg_abs_cache = {}  # background_images 原始串 -> (路径集合, 绝对路径列表)
+        self._personas_fingerprint = None  # 人格列表内容指纹，未变化时跳过重建
+        self._models_norm_index = None  # (模型列表对象, 归一化名索引)
+
+        # setup_ui 创建的部件引用先置 None：主题/关闭路径上的存在性
+        # 判断退化为一次 is not None，不再走 hasattr 的异常吞咽
+        self.sidebar = None
+        self.new_chat_btn = None
+        self.role_chat_btn = None
+        self.history_title = None
+        self.history_list = None
+        self.notification = None
+        self.notification_label = None
+        self.ollama_status_label = None
+        self.chat_page = None
+        self._window_theme_name = None
+        self._sidebar_theme_name = None
+
+        # 模型列表/设置页联动刷新的去抖：连续完成的操作只触发一次重建
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(150)
+        self._refresh_timer.timeout.connect(self._do_refresh_all)
+        self._history_refresh_pending = False  # 历史列表刷新合并标志
+
+        # 流式回复合帧：worker 只累积文本，GUI 定时器按 ~30Hz 刷新气泡
+        self._stream_dirty = False
+        self._stream_timer = QTimer(self)
+        self._stream_timer.setInterval(33)
+        self._stream_timer.timeout.connect(self._flush_stream)
+
         self.setup_ui()
         self.connect_signals()
         self.load_personal_settings()  # 加载个性化设置
@@ -90,29 +367,10 @@ class MainWindow(QMainWindow):
         """设置界面"""
         self.setWindowTitle("AI 助手")
         
-        # 设置窗口图标
-        import sys
-        icon_path = None
-        
-        if getattr(sys, 'frozen', False):
-            # 打包后：优先从 _MEIPASS 获取（PyInstaller 解压的临时目录）
-            meipass = getattr(sys, '_MEIPASS', None)
-            if meipass:
-                icon_path = os.path.join(meipass, "icon.ico")
-            
-            # 如果 _MEIPASS 中没有，尝试 exe 同级目录
-            if not icon_path or not os.path.exists(icon_path):
-                icon_path = os.path.join(os.path.dirname(sys.executable), "icon.ico")
-        else:
-            # 开发环境
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            icon_path = os.path.join(base_dir, "icon.ico")
-        
-        if icon_path and os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
-            print(f"[DEBUG] 窗口图标已设置: {icon_path}")
-        else:
-            print(f"[DEBUG] 图标文件未找到: {icon_path}")
+        # 设置窗口图标（路径分支见 core.paths，图标对象类级缓存）
+        icon = self.app_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
         
         # 设置初始尺寸和最小尺寸
         initial_width = 1280
@@ -120,7 +378,8 @@ class MainWindow(QMainWindow):
         
         self.setMinimumSize(800, 600)  # 设置合理的最小尺寸
         self.resize(initial_width, initial_height)
-        self.setStyleSheet(get_stylesheet())
+        self._current_qss = get_stylesheet()
+        self.setStyleSheet(self._current_qss)
         
         # 中央部件
         central = QWidget()
@@ -155,11 +414,22 @@ class MainWindow(QMainWindow):
         # 底部通知栏
         self.create_notification_bar(main_layout)
         
-        # 安装事件过滤器以捕获双击
-        self.installEventFilter(self)
-        self._last_click_time = 0
-        
-        self.theme.theme_changed.connect(self.on_theme_changed)
+        # 主题信号去抖：快速连续切换时把一串发射合并成最后一次处理，
+        # 避免每次发射都触发整棵控件树 re-polish
+        self._pending_theme = None
+        self._theme_debounce = QTimer(self)
+        self._theme_debounce.setSingleShot(True)
+        self._theme_debounce.setInterval(100)
+        self._theme_debounce.timeout.connect(self._flush_theme_change)
+        self.theme.theme_changed.connect(self._schedule_theme_change)
+
+        # Ollama 状态同理：探测回包可能密集到达，合并后只刷一次
+        self._pending_ollama_status = None
+        self._status_debounce = QTimer(self)
+        self._status_debounce.setSingleShot(True)
+        self._status_debounce.setInterval(100)
+        self._status_debounce.timeout.connect(self._flush_ollama_status)
+
         self.apply_theme()
     
     def create_sidebar(self, parent_layout):
@@ -174,7 +444,7 @@ class MainWindow(QMainWindow):
         
         # 新建对话按钮
         self.new_chat_btn = QPushButton("＋ 新建对话")
-        self.new_chat_btn.setFont(QFont("Microsoft YaHei UI", 13, QFont.Bold))
+        self.new_chat_btn.setFont(_FONT_BTN)
         self.new_chat_btn.setFixedHeight(48)
         self.new_chat_btn.setCursor(Qt.PointingHandCursor)
         self.new_chat_btn.clicked.connect(self.new_chat)
@@ -182,7 +452,7 @@ class MainWindow(QMainWindow):
         
         # 角色对话按钮（默认隐藏）
         self.role_chat_btn = QPushButton("🎭 角色对话")
-        self.role_chat_btn.setFont(QFont("Microsoft YaHei UI", 13, QFont.Bold))
+        self.role_chat_btn.setFont(_FONT_BTN)
         self.role_chat_btn.setFixedHeight(48)
         self.role_chat_btn.setCursor(Qt.PointingHandCursor)
         self.role_chat_btn.clicked.connect(self.new_role_chat)
@@ -196,23 +466,26 @@ class MainWindow(QMainWindow):
         
         # 历史记录标题
         self.history_title = QLabel("对话历史")
-        self.history_title.setFont(QFont("Microsoft YaHei UI", 11))
+        self.history_title.setFont(_FONT_LABEL_11)
         layout.addWidget(self.history_title)
         
-        # 历史记录滚动区域
-        self.history_scroll = QScrollArea()
-        self.history_scroll.setWidgetResizable(True)
-        self.history_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.history_scroll.setObjectName("historyScroll")
-        
-        self.history_container = QWidget()
-        self.history_layout = QVBoxLayout(self.history_container)
-        self.history_layout.setContentsMargins(0, 0, 8, 0)
-        self.history_layout.setSpacing(6)
-        self.history_layout.addStretch()
-        
-        self.history_scroll.setWidget(self.history_container)
-        layout.addWidget(self.history_scroll, 1)
+        # 历史记录列表（模型/视图：视图只绘制可见行，条目数量不影响开销）
+        self.history_model = ChatHistoryModel(self)
+        self.history_list = QListView()
+        self.history_list.setObjectName("historyList")
+        self.history_list.setModel(self.history_model)
+        self.history_list.setItemDelegate(HistoryItemDelegate(self.history_list))
+        self.history_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.history_list.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.history_list.setSelectionMode(QListView.SingleSelection)
+        self.history_list.setEditTriggers(QListView.NoEditTriggers)
+        self.history_list.setSpacing(3)
+        self.history_list.setMouseTracking(True)  # 悬停高亮需要鼠标跟踪
+        self.history_list.setCursor(Qt.PointingHandCursor)
+        self.history_list.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.history_list.customContextMenuRequested.connect(self.show_history_menu)
+        self.history_list.clicked.connect(self.on_history_clicked)
+        layout.addWidget(self.history_list, 1)
         
         # 底部状态
         self.create_sidebar_footer(layout)
@@ -225,7 +498,7 @@ class MainWindow(QMainWindow):
         
         # 状态标签
         self.ollama_status_label = QLabel("● 检测中...")
-        self.ollama_status_label.setFont(QFont("Microsoft YaHei UI", 10))
+        self.ollama_status_label.setFont(_FONT_LABEL_10)
         self.ollama_status_label.setAlignment(Qt.AlignCenter)
         c = self.theme.colors
         self.ollama_status_label.setStyleSheet(f"color: {c['text_secondary']};")
@@ -236,107 +509,123 @@ class MainWindow(QMainWindow):
         self.ollama_quick_btn.setFixedHeight(36)
         self.ollama_quick_btn.setCursor(Qt.PointingHandCursor)
         self.ollama_quick_btn.setVisible(False)
+        # 只连接一次到分发槽，按当前模式路由，省掉按状态 disconnect/connect
+        self.ollama_quick_btn.clicked.connect(self._on_ollama_btn_clicked)
         self.ollama_quick_layout.addWidget(self.ollama_quick_btn)
-        
-        # 跟踪按钮连接状态
-        self._ollama_btn_connected = False
-        
+
+        # 按钮当前模式："start" 启动服务 / "download" 打开下载页
+        self._ollama_btn_mode = "start"
+        # 状态缓存：状态未变化时跳过样式刷新
+        self._last_ollama_state = None
+
         layout.addWidget(self.ollama_quick_widget)
 
         parent_layout.addWidget(self.sidebar)
         
         self.apply_sidebar_theme()
     
+    @Slot(bool, bool)
+    def _schedule_ollama_quick_status(self, installed: bool, running: bool):
+        """合并密集到达的状态更新（如探测回包突发），只刷最后一次"""
+        self._pending_ollama_status = (installed, running)
+        self._status_debounce.start()
+
+    @Slot()
+    def _flush_ollama_status(self):
+        """状态去抖窗口结束，应用最后一次状态"""
+        if self._pending_ollama_status is not None:
+            self.update_ollama_quick_status(*self._pending_ollama_status)
+
+    @Slot(bool, bool)
     def update_ollama_quick_status(self, installed: bool, running: bool):
-        """更新侧边栏 Ollama 快捷状态"""
-        c = self.theme.colors
-        
+        """更新侧边栏 Ollama 快捷状态（状态未变化时直接返回）"""
+        state = (installed, running)
+        if state == self._last_ollama_state:
+            return
+        self._last_ollama_state = state
+
         if running:
             # 已运行，隐藏按钮
             self.ollama_status_label.setText("✅ 引擎运行中")
-            self.ollama_status_label.setStyleSheet(f"color: {c['success']};")
+            self.ollama_status_label.setStyleSheet(self._ollama_label_qss['success'])
             self.ollama_quick_btn.setVisible(False)
         elif installed:
             # 已安装未运行
             self.ollama_status_label.setText("⚠️ 引擎未启动")
-            self.ollama_status_label.setStyleSheet(f"color: {c['warning']};")
+            self.ollama_status_label.setStyleSheet(self._ollama_label_qss['warning'])
             self.ollama_quick_btn.setText("🚀 一键启动")
-            self.ollama_quick_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {c['accent']};
-                    color: white;
-                    border-radius: 8px;
-                    font-weight: 600;
-                    font-size: 12px;
-                }}
-                QPushButton:hover {{
-                    background-color: {c['accent_hover']};
-                }}
-            """)
+            self.ollama_quick_btn.setStyleSheet(self._ollama_btn_qss['start'])
             self.ollama_quick_btn.setVisible(True)
-            # 断开之前的连接，重新连接
-            if self._ollama_btn_connected:
-                try:
-                    self.ollama_quick_btn.clicked.disconnect()
-                except (TypeError, RuntimeError, AttributeError):
-                    pass
-            self.ollama_quick_btn.clicked.connect(self._quick_start_ollama)
-            self._ollama_btn_connected = True
+            self._ollama_btn_mode = "start"
         else:
             # 未安装
             self.ollama_status_label.setText("❌ 引擎未安装")
-            self.ollama_status_label.setStyleSheet(f"color: {c['error']};")
+            self.ollama_status_label.setStyleSheet(self._ollama_label_qss['error'])
             self.ollama_quick_btn.setText("📥 点击去下载")
-            self.ollama_quick_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {c['error']};
-                    color: white;
-                    border-radius: 8px;
-                    font-weight: 600;
-                    font-size: 12px;
-                }}
-                QPushButton:hover {{
-                    background-color: #c82333;
-                }}
-            """)
+            self.ollama_quick_btn.setStyleSheet(self._ollama_btn_qss['download'])
             self.ollama_quick_btn.setVisible(True)
-            # 断开之前的连接，重新连接
-            if self._ollama_btn_connected:
-                try:
-                    self.ollama_quick_btn.clicked.disconnect()
-                except (TypeError, RuntimeError, AttributeError):
-                    pass
-            self.ollama_quick_btn.clicked.connect(self._open_ollama_download)
+            self._ollama_btn_mode = "download"
+
+    @Slot()
+    def _on_ollama_btn_clicked(self):
+        """快捷按钮分发：按当前模式路由到启动或下载"""
+        if self._ollama_btn_mode == "start":
+            self._quick_start_ollama()
+        else:
+            self._open_ollama_download()
 
+    @Slot()
     def _quick_start_ollama(self):
         """快捷启动 Ollama"""
         self.ollama_quick_btn.setEnabled(False)
         self.ollama_quick_btn.setText("启动中...")
         self.set_notification("正在启动模型引擎...", "")
-        
+
+        if QtAsyncio is not None:
+            # 协程路径：await 后台执行，省掉 worker 对象和信号中转。
+            # 仅在确有 asyncio 循环在跑时才走（模块可导入不代表窗口
+            # 是 QtAsyncio.run 驱动的，quick_test.py 就是纯 app.exec）
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                asyncio.ensure_future(self._do_quick_start())
+                return
+
         def do_start():
             return self.ollama.start_service()
-        
-        def on_started(result):
-            success, msg = result
-            if success:
-                self.set_notification("✅ Ollama 启动成功", "success")
-                self.update_ollama_quick_status(True, True)
-                self.refresh_status()
-            else:
-                self.set_notification(f"❌ 启动失败: {msg}", "error")
-                self.ollama_quick_btn.setEnabled(True)
-                self.ollama_quick_btn.setText("🚀 一键启动")
-            
-            self.settings_page.update_ollama_status(
-                self.ollama.is_running(),
-                self.ollama.is_installed()
-            )
-        
+
         self.worker = WorkerThread(do_start)
-        self.worker.finished.connect(on_started)
+        self.worker.finished.connect(self._on_quick_start_done)
         self.worker.start()
 
+    async def _do_quick_start(self):
+        """协程方式启动 Ollama（QtAsyncio 事件循环下）"""
+        result = await asyncio.to_thread(self.ollama.start_service)
+        self._on_quick_start_done(result)
+
+    @Slot(object)
+    def _on_quick_start_done(self, result):
+        """快捷启动完成"""
+        if isinstance(result, Exception):
+            result = (False, str(result))
+        success, msg = result
+        if success:
+            self.set_notification("✅ Ollama 启动成功", "success")
+            self.update_ollama_quick_status(True, True)
+            self.refresh_status()
+        else:
+            self.set_notification(f"❌ 启动失败: {msg}", "error")
+            self.ollama_quick_btn.setEnabled(True)
+            self.ollama_quick_btn.setText("🚀 一键启动")
+
+        self.settings_page.update_ollama_status(
+            self.ollama.is_running(),
+            self.ollama.is_installed()
+        )
+
+    @Slot()
     def _open_ollama_download(self):
         """打开 Ollama 下载页面"""
         import webbrowser
@@ -358,13 +647,13 @@ class MainWindow(QMainWindow):
         layout.setContentsMargins(25, 0, 25, 0)
         
         self.notification_label = QLabel("就绪")
-        self.notification_label.setFont(QFont("Microsoft YaHei UI", 11))
+        self.notification_label.setFont(_FONT_LABEL_11)
         layout.addWidget(self.notification_label)
         
         layout.addStretch()
         
         version = QLabel("v1.0.0")
-        version.setFont(QFont("Microsoft YaHei UI", 10))
+        version.setFont(_FONT_LABEL_10)
         layout.addWidget(version)
         
         parent_layout.addWidget(self.notification)
@@ -374,7 +663,53 @@ class MainWindow(QMainWindow):
     def apply_sidebar_theme(self):
         """应用侧边栏主题"""
         c = self.theme.colors
-        
+
+        # 主题未变化时无需重建样式表（Qt 每次 setStyleSheet 都会重新解析）
+        theme_name = self.theme.current.get('name')
+        if self._sidebar_theme_name == theme_name:
+            return
+        self._sidebar_theme_name = theme_name
+
+        # 预构建 Ollama 快捷区各状态样式，状态轮询时直接取用
+        self._ollama_label_qss = {
+            'secondary': f"color: {c['text_secondary']};",
+            'success': f"color: {c['success']};",
+            'warning': f"color: {c['warning']};",
+            'error': f"color: {c['error']};",
+        }
+        self._ollama_btn_qss = {
+            'start': f"""
+                QPushButton {{
+                    background-color: {c['accent']};
+                    color: white;
+                    border-radius: 8px;
+                    font-weight: 600;
+                    font-size: 12px;
+                }}
+                QPushButton:hover {{
+                    background-color: {c['accent_hover']};
+                }}
+            """,
+            'download': f"""
+                QPushButton {{
+                    background-color: {c['error']};
+                    color: white;
+                    border-radius: 8px;
+                    font-weight: 600;
+                    font-size: 12px;
+                }}
+                QPushButton:hover {{
+                    background-color: #c82333;
+                }}
+            """,
+        }
+        # 主题变化后用缓存状态立即按新样式重刷（无需重新探测；
+        # 状态未知时等启动检测回报）
+        state = self._last_ollama_state
+        self._last_ollama_state = None
+        if state is not None:
+            self.update_ollama_quick_status(*state)
+
         self.sidebar.setStyleSheet(f"""
             QFrame#sidebar {{
                 background-color: {c['sidebar_bg']};
@@ -400,12 +735,13 @@ class MainWindow(QMainWindow):
             }}
         """)
         
-        # 历史记录滚动条样式
-        if hasattr(self, 'history_scroll'):
-            self.history_scroll.setStyleSheet(f"""
-                QScrollArea {{
+        # 历史记录列表样式（条目外观由 HistoryItemDelegate 绘制）
+        if self.history_list is not None:
+            self.history_list.setStyleSheet(f"""
+                QListView {{
                     border: none;
                     background-color: transparent;
+                    padding-right: 8px;
                 }}
                 QScrollBar:vertical {{
                     background-color: transparent;
@@ -429,6 +765,8 @@ class MainWindow(QMainWindow):
                     background: none;
                 }}
             """)
+            # 代理直接用主题色绘制，切换主题后强制重绘可见行
+            self.history_list.viewport().update()
     
     def apply_notification_theme(self):
         """应用通知栏主题"""
@@ -441,11 +779,29 @@ class MainWindow(QMainWindow):
         
         self.notification_label.setStyleSheet(f"color: {c['text_secondary']};")
     
+    @Slot(dict)
+    def _schedule_theme_change(self, theme):
+        """主题变化入口：重启去抖计时器，把发射突发合并为一次处理"""
+        self._pending_theme = theme
+        self._theme_debounce.start()
+
+    @Slot()
+    def _flush_theme_change(self):
+        """去抖窗口结束，真正应用最后一次主题"""
+        self.on_theme_changed(self._pending_theme)
+
+    @Slot(dict)
     def on_theme_changed(self, theme):
         """主题更改"""
-        self.setStyleSheet(get_stylesheet(theme))
+        # 样式串按主题名缓存（同一主题返回同一对象），未变化时跳过
+        # 全窗口 setStyleSheet 触发的整棵子树 re-polish
+        qss = get_stylesheet(theme)
+        if qss is not self._current_qss:
+            self._current_qss = qss
+            self.setStyleSheet(qss)
         self.apply_sidebar_theme()
         self.apply_notification_theme()
+        self.apply_theme()
     
     @Slot(str, str, str, list, int)
     def on_personal_changed(self, user_name: str, avatar_path: str, avatar_color: str, 
@@ -458,72 +814,130 @@ class MainWindow(QMainWindow):
     def load_personal_settings(self):
         """加载个性化设置并应用到对话页面"""
         from core.database import get_database
-        from core.media_manager import get_media_manager
-        
-        # 从数据库加载个性化设置
+
+        # 一次 SELECT 批量读取，避免 5 次数据库往返
         db = get_database()
-        user_name = db.get_personal_setting('user_name', '我')
-        avatar_path = db.get_personal_setting('user_avatar_path')
-        avatar_color = db.get_personal_setting('user_avatar_color', '#007AFF')
-        backgrounds = db.get_personal_setting('chat_backgrounds', [])
-        interval = db.get_personal_setting('background_interval', 5)
-        
-        print(f"[DEBUG] 从数据库加载个性化设置:")
-        print(f"[DEBUG]   user_name: {user_name}")
-        print(f"[DEBUG]   avatar_path: {avatar_path}")
-        print(f"[DEBUG]   avatar_color: {avatar_color}")
-        print(f"[DEBUG]   backgrounds: {backgrounds}")
-        print(f"[DEBUG]   interval: {interval}")
-        
-        # 转换背景图片为绝对路径
+        settings = db.get_personal_settings_bulk([
+            'user_name', 'user_avatar_path', 'user_avatar_color',
+            'chat_backgrounds', 'background_interval',
+        ])
+        user_name = settings.get('user_name', '我')
+        avatar_path = settings.get('user_avatar_path')
+        avatar_color = settings.get('user_avatar_color', '#007AFF')
+        backgrounds = settings.get('chat_backgrounds') or []
+        interval = settings.get('background_interval', 5)
+
+        # 影响初始布局的字段同步应用（头像路径保持相对路径，由 ChatBubble 处理）
+        self.chat_page.set_user_name(user_name)
+        self.chat_page.set_user_avatar(avatar_path, avatar_color)
+
+        # 背景图片的存在性检查是磁盘 I/O，放到线程池，完成后回主线程应用
+        self._personal_bg_worker = WorkerThread(
+            self._resolve_background_paths, backgrounds, interval
+        )
+        self._personal_bg_worker.finished.connect(self._on_personal_backgrounds_ready)
+        self._personal_bg_worker.start()
+
+    @staticmethod
+    def _resolve_background_paths(backgrounds, interval):
+        """解析背景图片绝对路径并过滤掉不存在的文件（线程池中执行）"""
+
         media_manager = get_media_manager()
-        
         absolute_backgrounds = []
         for bg in backgrounds:
             abs_path = media_manager.get_absolute_path(bg)
             if os.path.exists(abs_path):
                 absolute_backgrounds.append(abs_path)
-        
-        # 应用到对话页面（头像路径保持相对路径，由 ChatBubble 处理）
-        self.chat_page.set_user_name(user_name)
-        self.chat_page.set_user_avatar(avatar_path, avatar_color)
+        return absolute_backgrounds, interval
+
+    @Slot(object)
+    def _on_personal_backgrounds_ready(self, result):
+        """背景路径解析完成，应用到对话页面"""
+        if isinstance(result, Exception):
+            logger.error(f"加载背景设置失败: {result}")
+            return
+        absolute_backgrounds, interval = result
         self.chat_page.set_chat_backgrounds(absolute_backgrounds, interval)
     
     def load_personal_backgrounds(self):
         """仅加载个性化背景设置"""
-        import json
-        import sys
-        from core.media_manager import get_media_manager
-        
-        if getattr(sys, 'frozen', False):
-            base_dir = os.path.dirname(sys.executable)
-        else:
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
-        config_path = os.path.join(base_dir, 'personal_settings.json')
-        
+
+        # 配置路径在 core.paths 导入时解析一次，这里不再做 frozen 分支
+        config_path = PERSONAL_SETTINGS_PATH
+
         backgrounds = []
         interval = 5
-        
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                backgrounds = data.get('chat_backgrounds', [])
-                interval = data.get('background_interval', 5)
-            except Exception as e:
-                print(f"加载背景设置失败: {e}")
-        
-        # 转换为绝对路径
-        media_manager = get_media_manager()
-        absolute_backgrounds = []
-        for bg in backgrounds:
-            abs_path = media_manager.get_absolute_path(bg)
-            if os.path.exists(abs_path):
-                absolute_backgrounds.append(abs_path)
-        
+
+        try:
+            st = os.stat(config_path)
+        except OSError:
+            st = None
+
+        if st is not None:
+            if st.st_mtime == self._bg_cache_mtime:
+                # 文件没变化，复用上次的解析结果，省掉读盘 + JSON 解析
+                backgrounds, interval = self._bg_cache_data
+            else:
+                try:
+                    with open(config_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    backgrounds = data.get('chat_backgrounds', [])
+                    interval = data.get('background_interval', 5)
+                    self._bg_cache_mtime = st.st_mtime
+                    self._bg_cache_data = (backgrounds, interval)
+                except Exception as e:
+                    logger.error("加载背景设置失败: %s", e)
+
+        # 转换为绝对路径（路径集合查找，不逐张 stat）
+        valid = self.media_manager.valid_paths
+        absolute_backgrounds = [self.media_manager.get_absolute_path(bg)
+                                for bg in backgrounds if bg in valid]
+
         self.chat_page.set_chat_backgrounds(absolute_backgrounds, interval)
 
+    def _resolve_backgrounds(self, persona: dict) -> list:
+        """解析角色的背景图片为绝对路径列表
+
+        用 MediaManager 的路径集合做查找，避免逐张图片一次 stat 系统调用；
+        背景字段缺失、JSON 损坏或文件全部丢失时统一返回空列表。
+        """
+
+        background_images_str = persona.get('background_images', '')
+        if not background_images_str:
+            return []
+        # 同一个角色的背景串每次切换都相同，解析一次后复用
+        background_images = self._bg_parse_cache.get(background_images_str)
+        if background_images is None:
+            try:
+                background_images = json.loads(background_images_str)
+            except Exception:
+                background_images = []
+            self._bg_parse_cache[background_images_str] = background_images
+        if not background_images:
+            return []
+
+        # 绝对路径结果同样缓存；媒体文件增删会换一个新的路径集合对象，
+        # 用身份比较感知失效，不需要额外的失效钩子
+        valid = self.media_manager.valid_paths
+        cached = self._bg_abs_cache.get(background_images_str)
+        if cached is not None and cached[0] is valid:
+            return cached[1]
+
+        resolved = [self.media_manager.get_absolute_path(bg)
+                    for bg in background_images if bg in valid]
+        self._bg_abs_cache[background_images_str] = (valid, resolved)
+        return resolved
+
+    def _apply_persona_backgrounds(self, persona: dict, persona_key: str):
+        """应用角色背景：无有效背景时 default 角色回退到个性化设置"""
+        absolute_backgrounds = self._resolve_backgrounds(persona)
+        if absolute_backgrounds:
+            self.chat_page.set_chat_backgrounds(absolute_backgrounds, 5)
+        elif persona_key == 'default':
+            self.load_personal_backgrounds()
+        else:
+            self.chat_page.set_chat_backgrounds([], 5)
+
     def connect_signals(self):
         """连接信号"""
         self.chat_page.settings_clicked.connect(self.show_settings)
@@ -540,17 +954,20 @@ class MainWindow(QMainWindow):
         self.settings_page.theme_changed.connect(self.on_theme_setting_changed)
 
         self.settings_page.personal_changed.connect(self.on_personal_changed)
-        self.theme.theme_changed.connect(self.apply_theme)
+        # 注意：theme_changed 只连接去抖入口（setup_ui），由 on_theme_changed
+        # 统一调用 apply_theme，避免同一信号触发两条重绘路径
         # 人格相关
         self.chat_page.new_chat_with_persona.connect(self.new_chat_with_persona)
         self.settings_page.persona_added.connect(self.add_persona)
         self.settings_page.persona_deleted.connect(self.delete_persona)
         self.settings_page.persona_edited.connect(self.edit_persona)
 
+    @Slot()
     def show_chat(self):
         """显示聊天页面"""
         self.main_stack.setCurrentWidget(self.chat_container)
     
+    @Slot()
     def show_settings(self):
         """显示设置页面"""
         self.refresh_settings_data()
@@ -558,13 +975,26 @@ class MainWindow(QMainWindow):
     
     def refresh_settings_data(self):
         """刷新设置页面数据（保留下载状态）"""
+        # 四个 update_* 会连续重建大量子控件，先关掉重绘和信号，
+        # 整批更新完后一次性重绘，避免每步各刷一遍
+        self.settings_page.setUpdatesEnabled(False)
+        self.settings_page.blockSignals(True)
+        try:
+            self._do_refresh_settings_data()
+        finally:
+            self.settings_page.blockSignals(False)
+            self.settings_page.setUpdatesEnabled(True)
+            self.settings_page.update()
+
+    def _do_refresh_settings_data(self):
+        """刷新设置页面数据的实际工作"""
         running = self.ollama.is_running()
         installed = self.ollama.is_installed()
         self.settings_page.update_ollama_status(running, installed)
-        
+
         hw_info = detect_hardware()
         self.settings_page.update_hardware_info(hw_info)
-        
+
         # 优先从 Ollama 获取已安装模型，如果服务未运行则从数据库获取
         if running:
             installed_models_raw = self.ollama.list_models()
@@ -616,7 +1046,6 @@ class MainWindow(QMainWindow):
     @Slot(str)
     def new_chat_with_persona(self, persona_key: str):
         """使用指定人格创建新对话"""
-        from core.media_manager import get_media_manager
         
         # 检查是否正在生成中
         if self.chat_manager.is_generating:
@@ -656,9 +1085,7 @@ class MainWindow(QMainWindow):
         
         # 检查文件是否存在（但传递相对路径）
         if ai_icon_path:
-            media_manager = get_media_manager()
-            absolute_path = media_manager.get_absolute_path(ai_icon_path)
-            if not os.path.exists(absolute_path):
+            if ai_icon_path not in self.media_manager.valid_paths:
                 ai_icon_path = ''  # 文件不存在，清空路径
         
         self.chat_page.set_ai_name(ai_name)
@@ -666,47 +1093,10 @@ class MainWindow(QMainWindow):
         self.chat_page.set_ai_avatar(ai_icon_path)  # 传递相对路径
         
         # 设置背景图片（优先使用角色的背景，如果没有则使用个性化设置）
-        background_images_str = persona.get('background_images', '')
-        if background_images_str:
-            try:
-                background_images = json.loads(background_images_str)
-                if background_images:
-                    # 转换为绝对路径
-                    absolute_backgrounds = []
-                    for bg in background_images:
-                        abs_path = media_manager.get_absolute_path(bg)
-                        if os.path.exists(abs_path):
-                            absolute_backgrounds.append(abs_path)
-                    
-                    if absolute_backgrounds:
-                        self.chat_page.set_chat_backgrounds(absolute_backgrounds, 5)
-                    elif persona_key == 'default':
-                        self.load_personal_backgrounds()
-                    else:
-                        self.chat_page.set_chat_backgrounds([], 5)
-                else:
-                    if persona_key == 'default':
-                        self.load_personal_backgrounds()
-                    else:
-                        self.chat_page.set_chat_backgrounds([], 5)
-            except:
-                if persona_key == 'default':
-                    self.load_personal_backgrounds()
-                else:
-                    self.chat_page.set_chat_backgrounds([], 5)
-        else:
-            if persona_key == 'default':
-                self.load_personal_backgrounds()
-            else:
-                self.chat_page.set_chat_backgrounds([], 5)
-        
+        self._apply_persona_backgrounds(persona, persona_key)
+
         # 取消历史选中
-        if self.current_history_item:
-            try:
-                self.current_history_item.set_active(False)
-            except RuntimeError:
-                pass
-            self.current_history_item = None
+        self.history_list.clearSelection()
         
         # 如果是角色扮演，检查是否为系统角色
         if persona.get('type') == 'roleplay':
@@ -789,98 +1179,13 @@ class MainWindow(QMainWindow):
     @Slot(str)
     def delete_persona(self, key: str):
         """删除助手/角色"""
-        # 创建自定义对话框
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-        from PySide6.QtCore import Qt
-        from PySide6.QtGui import QFont
-        
-        dialog = QDialog(self)
-        dialog.setWindowTitle("确认删除")
-        dialog.setFixedWidth(400)
-        dialog.setModal(True)
-        
-        c = self.theme.colors
-        dialog.setStyleSheet(f"""
-            QDialog {{
-                background-color: {c['bg']};
-                border-radius: 12px;
-            }}
-        """)
-        
-        layout = QVBoxLayout(dialog)
-        layout.setContentsMargins(30, 30, 30, 25)
-        layout.setSpacing(20)
-        
-        # 图标和标题
-        title_layout = QHBoxLayout()
-        title_layout.setSpacing(12)
-        
-        icon_label = QLabel("⚠️")
-        icon_label.setFont(QFont("Segoe UI Emoji", 32))
-        title_layout.addWidget(icon_label)
-        
-        title_text = QLabel("确认删除助手")
-        title_text.setFont(QFont("Microsoft YaHei UI", 16, QFont.Bold))
-        title_text.setStyleSheet(f"color: {c['text']};")
-        title_layout.addWidget(title_text, 1)
-        
-        layout.addLayout(title_layout)
-        
-        # 提示信息
-        message = QLabel("确定要删除这个助手/角色吗？\n删除后将无法恢复。")
-        message.setFont(QFont("Microsoft YaHei UI", 12))
-        message.setStyleSheet(f"color: {c['text_secondary']}; line-height: 1.6;")
-        message.setWordWrap(True)
-        layout.addWidget(message)
-        
-        # 按钮
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(12)
-        button_layout.addStretch()
-        
-        cancel_btn = QPushButton("取消")
-        cancel_btn.setFixedSize(100, 40)
-        cancel_btn.setCursor(Qt.PointingHandCursor)
-        cancel_btn.setFont(QFont("Microsoft YaHei UI", 12))
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {c['bg_tertiary']};
-                color: {c['text']};
-                border: 2px solid {c['border']};
-                border-radius: 10px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {c['hover']};
-                border-color: {c['text_dim']};
-            }}
-        """)
-        cancel_btn.clicked.connect(dialog.reject)
-        button_layout.addWidget(cancel_btn)
-        
-        delete_btn = QPushButton("删除")
-        delete_btn.setFixedSize(100, 40)
-        delete_btn.setCursor(Qt.PointingHandCursor)
-        delete_btn.setFont(QFont("Microsoft YaHei UI", 12, QFont.Bold))
-        delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {c['error']};
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: #c82333;
-            }}
-        """)
-        delete_btn.clicked.connect(dialog.accept)
-        button_layout.addWidget(delete_btn)
-        
-        layout.addLayout(button_layout)
-        
-        # 显示对话框
-        if dialog.exec() == QDialog.Accepted:
+        confirmed = self.show_confirm_dialog(
+            "确认删除助手",
+            "确定要删除这个助手/角色吗？\n删除后将无法恢复。",
+            confirm_text="删除",
+            confirm_danger=True
+        )
+        if confirmed:
             if self.chat_manager.delete_persona(key):
                 self.refresh_personas()
                 self.set_notification("✅ 已删除", "success")
@@ -898,10 +1203,20 @@ class MainWindow(QMainWindow):
         type_name = "角色" if persona_type == "roleplay" else "助手"
         self.set_notification(f"✅ 已更新{type_name}: {name}", "success")
     
-    @Slot(dict)
+    @Slot()
     def refresh_personas(self):
-        """刷新人格列表"""
+        """刷新人格列表（内容未变化时跳过下游重建）"""
         personas = self.chat_manager.get_personas()
+
+        # 设置页会整体拆掉重建全部卡片，内容没变就别打扰它
+        try:
+            fingerprint = json.dumps(personas, sort_keys=True, ensure_ascii=False, default=str)
+        except Exception:
+            fingerprint = None
+        if fingerprint is not None and fingerprint == self._personas_fingerprint:
+            return
+        self._personas_fingerprint = fingerprint
+
         self.chat_page.set_personas(personas)
         self.settings_page.update_personas(personas)
 
@@ -952,6 +1267,7 @@ class MainWindow(QMainWindow):
         running = result.get('running')
         installed = result.get('installed')
         models = result.get('models', [])
+        self._models_cache = models
         auto_started = result.get('auto_started', False)
         start_error = result.get('start_error')
         
@@ -1003,130 +1319,66 @@ class MainWindow(QMainWindow):
         Returns:
             用户是否点击确认
         """
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-        from PySide6.QtCore import Qt
-        from PySide6.QtGui import QFont
-        
-        dialog = QDialog(self)
-        dialog.setWindowTitle(title)
-        dialog.setFixedWidth(420)
-        dialog.setModal(True)
-        
+        # 复用预构建的弹窗实例，避免每次点击重建控件和解析 QSS
+        return self._confirm_dialog.ask(
+            title, message, icon, confirm_text, cancel_text, confirm_danger
+        )
+    
+    def refresh_history(self):
+        """刷新历史记录（80ms 内的重复请求合并为一次）"""
+        if self._history_refresh_pending:
+            return
+        self._history_refresh_pending = True
+        QTimer.singleShot(80, self._do_refresh_history)
+
+    @Slot()
+    def _do_refresh_history(self):
+        """真正执行历史列表刷新"""
+        self._history_refresh_pending = False
+        histories = self.chat_manager.list_history()
+        self.history_model.set_histories(histories[:30])
+
+    @Slot(QModelIndex)
+    def on_history_clicked(self, index):
+        """点击历史记录项"""
+        data = self.history_model.data(index, ChatHistoryModel.DataRole)
+        if data:
+            self.load_history(data)
+
+    @Slot(QPoint)
+    def show_history_menu(self, pos):
+        """历史记录右键菜单"""
+
+        index = self.history_list.indexAt(pos)
+        if not index.isValid():
+            return
+        data = self.history_model.data(index, ChatHistoryModel.DataRole)
+
         c = self.theme.colors
-        dialog.setStyleSheet(f"""
-            QDialog {{
-                background-color: {c['bg']};
-                border-radius: 12px;
-            }}
-        """)
-        
-        layout = QVBoxLayout(dialog)
-        layout.setContentsMargins(30, 25, 30, 25)
-        layout.setSpacing(18)
-        
-        # 图标和标题
-        title_layout = QHBoxLayout()
-        title_layout.setSpacing(12)
-        
-        icon_label = QLabel(icon)
-        icon_label.setFont(QFont("Segoe UI Emoji", 28))
-        title_layout.addWidget(icon_label)
-        
-        title_text = QLabel(title)
-        title_text.setFont(QFont("Microsoft YaHei UI", 15, QFont.Bold))
-        title_text.setStyleSheet(f"color: {c['text']};")
-        title_layout.addWidget(title_text, 1)
-        
-        layout.addLayout(title_layout)
-        
-        # 提示信息
-        msg_label = QLabel(message)
-        msg_label.setFont(QFont("Microsoft YaHei UI", 11))
-        msg_label.setStyleSheet(f"color: {c['text_secondary']}; line-height: 1.5;")
-        msg_label.setWordWrap(True)
-        layout.addWidget(msg_label)
-        
-        # 按钮
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(12)
-        button_layout.addStretch()
-        
-        cancel_btn = QPushButton(cancel_text)
-        cancel_btn.setFixedSize(100, 38)
-        cancel_btn.setCursor(Qt.PointingHandCursor)
-        cancel_btn.setFont(QFont("Microsoft YaHei UI", 11))
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {c['bg_tertiary']};
+        menu = QMenu(self.history_list)
+        menu.setStyleSheet(f"""
+            QMenu {{
+                background-color: {c['card_bg']};
                 color: {c['text']};
-                border: 2px solid {c['border']};
+                border: 1px solid {c['border']};
                 border-radius: 10px;
-                font-weight: 500;
+                padding: 8px;
             }}
-            QPushButton:hover {{
+            QMenu::item {{
+                padding: 10px 20px;
+                border-radius: 6px;
+            }}
+            QMenu::item:selected {{
                 background-color: {c['hover']};
-                border-color: {c['text_dim']};
             }}
         """)
-        cancel_btn.clicked.connect(dialog.reject)
-        button_layout.addWidget(cancel_btn)
-        
-        confirm_btn = QPushButton(confirm_text)
-        confirm_btn.setFixedSize(100, 38)
-        confirm_btn.setCursor(Qt.PointingHandCursor)
-        confirm_btn.setFont(QFont("Microsoft YaHei UI", 11, QFont.Bold))
-        
-        if confirm_danger:
-            confirm_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {c['error']};
-                    color: white;
-                    border: none;
-                    border-radius: 10px;
-                    font-weight: 600;
-                }}
-                QPushButton:hover {{
-                    background-color: #c82333;
-                }}
-            """)
-        else:
-            confirm_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {c['accent']};
-                    color: white;
-                    border: none;
-                    border-radius: 10px;
-                    font-weight: 600;
-                }}
-                QPushButton:hover {{
-                    background-color: {c['accent_hover']};
-                }}
-            """)
-        
-        confirm_btn.clicked.connect(dialog.accept)
-        button_layout.addWidget(confirm_btn)
-        
-        layout.addLayout(button_layout)
-        
-        return dialog.exec() == QDialog.Accepted
-    
-    def refresh_history(self):
-        """刷新历史记录"""
-         # 刷新前重置引用
-        self.current_history_item = None
-        # 清空
-        while self.history_layout.count() > 1:
-            item = self.history_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        histories = self.chat_manager.list_history()
-        
-        for h in histories[:30]:
-            item = HistoryItem(h)
-            item.clicked_with_data.connect(self.load_history)
-            item.delete_requested.connect(self.delete_history)
-            self.history_layout.insertWidget(self.history_layout.count() - 1, item)
+
+        delete_action = menu.addAction("🗑️ 删除对话")
+        delete_action.triggered.connect(
+            lambda: self.delete_history(data.get('filename', ''))
+        )
+
+        menu.exec(self.history_list.viewport().mapToGlobal(pos))
     
     def save_current_chat(self):
         """保存当前对话"""
@@ -1134,8 +1386,9 @@ class MainWindow(QMainWindow):
             try:
                 self.chat_manager.save_history(self.current_chat_id)
             except Exception as e:
-                print(f"保存对话失败: {e}")
+                logger.error("保存对话失败: %s", e)
 
+    @Slot()
     def new_chat(self):
         """新建对话 - 只显示助手选择"""
         # 检查是否正在生成中
@@ -1157,12 +1410,7 @@ class MainWindow(QMainWindow):
         self.current_chat_id = None
         
         # 取消历史选中
-        if self.current_history_item:
-            try:
-                self.current_history_item.set_active(False)
-            except RuntimeError:
-                pass
-            self.current_history_item = None
+        self.history_list.clearSelection()
             
         
         # 显示欢迎界面（只显示助手）
@@ -1170,6 +1418,7 @@ class MainWindow(QMainWindow):
         self.chat_page.set_title("新对话")
         self.chat_page.show_welcome_assistants_only()
     
+    @Slot()
     def new_role_chat(self):
         """新建角色对话 - 只显示角色选择"""
         # 检查是否正在生成中
@@ -1191,12 +1440,7 @@ class MainWindow(QMainWindow):
         self.current_chat_id = None
         
         # 取消历史选中
-        if self.current_history_item:
-            try:
-                self.current_history_item.set_active(False)
-            except RuntimeError:
-                pass
-            self.current_history_item = None
+        self.history_list.clearSelection()
         
         # 显示欢迎界面（只显示角色）
         self.chat_page.clear_messages()
@@ -1206,7 +1450,6 @@ class MainWindow(QMainWindow):
     @Slot(dict)
     def load_history(self, data):
         """加载历史对话"""
-        from core.media_manager import get_media_manager
         
         # 检查是否正在生成中
         if self.chat_manager.is_generating:
@@ -1226,34 +1469,18 @@ class MainWindow(QMainWindow):
             self.chat_page.current_ai_bubble = None
         
         try:
-            # 重置当前历史项引用
-            if self.current_history_item:
-                try:
-                    # 检查对象是否仍然有效
-                    self.current_history_item.set_active(False)
-                except RuntimeError:
-                    # 对象已被删除，忽略
-                    pass
-                self.current_history_item = None
-            
             filename = data.get('filename', '')
             chat_id = filename.replace('.json', '')
-            
+
             # 加载对话数据
             loaded = self.chat_manager.load_history(chat_id)
-            
+
             if not loaded:
+                # 选中状态由视图的选择模型维护，加载失败时取消选中
+                self.history_list.clearSelection()
                 self.set_notification("加载失败：对话不存在", "error")
                 return
-            
-            if self.current_history_item:
-                self.current_history_item.set_active(False)
-            
-            sender = self.sender()
-            if isinstance(sender, HistoryItem):
-                sender.set_active(True)
-                self.current_history_item = sender
-            
+
             # 设置标题
             title = loaded.get('title', '对话')
             self.chat_page.set_title(title)
@@ -1273,9 +1500,7 @@ class MainWindow(QMainWindow):
             
             # 检查文件是否存在（但传递相对路径）
             if ai_icon_path:
-                media_manager = get_media_manager()
-                absolute_path = media_manager.get_absolute_path(ai_icon_path)
-                if not os.path.exists(absolute_path):
+                if ai_icon_path not in self.media_manager.valid_paths:
                     ai_icon_path = ''  # 文件不存在，清空路径
             
             self.chat_page.set_ai_name(ai_name)
@@ -1283,39 +1508,7 @@ class MainWindow(QMainWindow):
             self.chat_page.set_ai_avatar(ai_icon_path)  # 传递相对路径
             
             # 设置背景图片（优先使用角色的背景）
-            background_images_str = persona.get('background_images', '')
-            if background_images_str:
-                try:
-                    background_images = json.loads(background_images_str)
-                    if background_images:
-                        # 转换为绝对路径
-                        absolute_backgrounds = []
-                        for bg in background_images:
-                            abs_path = media_manager.get_absolute_path(bg)
-                            if os.path.exists(abs_path):
-                                absolute_backgrounds.append(abs_path)
-                        
-                        if absolute_backgrounds:
-                            self.chat_page.set_chat_backgrounds(absolute_backgrounds, 5)
-                        elif persona_key == 'default':
-                            self.load_personal_backgrounds()
-                        else:
-                            self.chat_page.set_chat_backgrounds([], 5)
-                    else:
-                        if persona_key == 'default':
-                            self.load_personal_backgrounds()
-                        else:
-                            self.chat_page.set_chat_backgrounds([], 5)
-                except:
-                    if persona_key == 'default':
-                        self.load_personal_backgrounds()
-                    else:
-                        self.chat_page.set_chat_backgrounds([], 5)
-            else:
-                if persona_key == 'default':
-                    self.load_personal_backgrounds()
-                else:
-                    self.chat_page.set_chat_backgrounds([], 5)
+            self._apply_persona_backgrounds(persona, persona_key)
             
             # 获取所有消息（按时间排序）
             all_messages = self.chat_manager.get_all_messages_sorted()
@@ -1330,8 +1523,8 @@ class MainWindow(QMainWindow):
                 last_model = all_messages[-1].get('model')
             
             if last_model:
-                # 检查模型是否存在于当前 Ollama 中
-                available_models = self.ollama.list_models()
+                # 检查模型是否存在（用缓存列表，避免每次切换历史都阻塞查询）
+                available_models = self._models_cache or self.ollama.list_models()
                 model_exists = any(m['name'] == last_model for m in available_models)
                 
                 if model_exists:
@@ -1352,107 +1545,22 @@ class MainWindow(QMainWindow):
             self.set_notification(f"已加载对话：{title}", "")
             
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("加载对话失败")
             self.set_notification(f"加载失败: {e}", "error")
 
     @Slot(str)
     def delete_history(self, filename):
         """删除历史记录"""
-        # 创建自定义对话框
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-        from PySide6.QtCore import Qt
-        from PySide6.QtGui import QFont
-        
-        dialog = QDialog(self)
-        dialog.setWindowTitle("确认删除")
-        dialog.setFixedWidth(400)
-        dialog.setModal(True)
-        
-        c = self.theme.colors
-        dialog.setStyleSheet(f"""
-            QDialog {{
-                background-color: {c['bg']};
-                border-radius: 12px;
-            }}
-        """)
-        
-        layout = QVBoxLayout(dialog)
-        layout.setContentsMargins(30, 30, 30, 25)
-        layout.setSpacing(20)
-        
-        # 图标和标题
-        title_layout = QHBoxLayout()
-        title_layout.setSpacing(12)
-        
-        icon_label = QLabel("⚠️")
-        icon_label.setFont(QFont("Segoe UI Emoji", 32))
-        title_layout.addWidget(icon_label)
-        
-        title_text = QLabel("确认删除对话")
-        title_text.setFont(QFont("Microsoft YaHei UI", 16, QFont.Bold))
-        title_text.setStyleSheet(f"color: {c['text']};")
-        title_layout.addWidget(title_text, 1)
-        
-        layout.addLayout(title_layout)
-        
-        # 提示信息
-        message = QLabel("确定要删除这条对话记录吗？\n删除后将无法恢复。")
-        message.setFont(QFont("Microsoft YaHei UI", 12))
-        message.setStyleSheet(f"color: {c['text_secondary']}; line-height: 1.6;")
-        message.setWordWrap(True)
-        layout.addWidget(message)
-        
-        # 按钮
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(12)
-        button_layout.addStretch()
-        
-        cancel_btn = QPushButton("取消")
-        cancel_btn.setFixedSize(100, 40)
-        cancel_btn.setCursor(Qt.PointingHandCursor)
-        cancel_btn.setFont(QFont("Microsoft YaHei UI", 12))
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {c['bg_tertiary']};
-                color: {c['text']};
-                border: 2px solid {c['border']};
-                border-radius: 10px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {c['hover']};
-                border-color: {c['text_dim']};
-            }}
-        """)
-        cancel_btn.clicked.connect(dialog.reject)
-        button_layout.addWidget(cancel_btn)
-        
-        delete_btn = QPushButton("删除")
-        delete_btn.setFixedSize(100, 40)
-        delete_btn.setCursor(Qt.PointingHandCursor)
-        delete_btn.setFont(QFont("Microsoft YaHei UI", 12, QFont.Bold))
-        delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {c['error']};
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: #c82333;
-            }}
-        """)
-        delete_btn.clicked.connect(dialog.accept)
-        button_layout.addWidget(delete_btn)
-        
-        layout.addLayout(button_layout)
-        
-        # 显示对话框
-        if dialog.exec() == QDialog.Accepted:
+        confirmed = self.show_confirm_dialog(
+            "确认删除对话",
+            "确定要删除这条对话记录吗？\n删除后将无法恢复。",
+            confirm_text="删除",
+            confirm_danger=True
+        )
+        if confirmed:
             if self.chat_manager.delete_history(filename):
-                self.refresh_history()
+                # 增量删除单行，不整表重建
+                self.history_model.remove_history(filename)
                 self.set_notification("已删除对话", "success")
             else:
                 self.set_notification("删除失败", "error")
@@ -1499,17 +1607,15 @@ class MainWindow(QMainWindow):
         self.set_notification("正在生成回复...", "")
         
         self.ai_response_text = ""
-        
+        self._stream_dirty = False
+        self._stream_timer.start()
+
         def stream_callback(chunk):
+            # 只做累积和打脏标记：每个 token 都跨线程刷一次 UI 太贵，
+            # 由 GUI 线程的 _stream_timer 合并成每帧一次
             self.ai_response_text += chunk
-            from PySide6.QtCore import QMetaObject, Qt, Q_ARG
-            QMetaObject.invokeMethod(
-                self.chat_page,
-                "update_ai_response",
-                Qt.QueuedConnection,
-                Q_ARG(str, self.ai_response_text)
-            )
-        
+            self._stream_dirty = True
+
         def do_chat():
             logger.info("do_chat 开始执行")
             result = self.chat_manager.chat(text, stream_callback=stream_callback, options=model_options)
@@ -1521,6 +1627,13 @@ class MainWindow(QMainWindow):
         logger.info("send_message: 启动 chat_worker")
         self.chat_worker.start()
     
+    @Slot()
+    def _flush_stream(self):
+        """把累积的流式文本刷到 AI 气泡（每个计时器周期最多一次）"""
+        if self._stream_dirty:
+            self._stream_dirty = False
+            self.chat_page.update_ai_response(self.ai_response_text)
+
     @Slot()
     def stop_generation(self):
         """停止生成"""
@@ -1534,7 +1647,10 @@ class MainWindow(QMainWindow):
         """聊天完成回调"""
         # 检查是否是用户停止的
         was_stopped = self._stop_requested
-        
+
+        # 停掉合帧计时器并补一次最终刷新，保证完整文本上屏
+        self._stream_timer.stop()
+        self._flush_stream()
         self.chat_page.finish_ai_response()
         self.chat_page.set_send_enabled(True)
         
@@ -1569,31 +1685,21 @@ class MainWindow(QMainWindow):
                 logger.info("触发 generate_suggestions")
                 QTimer.singleShot(500, self.generate_suggestions)
     
+    @Slot()
     def generate_suggestions(self):
         """生成推荐回复选项（后台线程）"""
-        # 获取最后一条 AI 消息
-        messages = self.chat_manager.get_all_messages_sorted()
-        if not messages:
-            logger.info("generate_suggestions: 没有消息")
-            return
-        
-        last_ai_msg = None
-        for msg in reversed(messages):
-            if msg.get('role') == 'assistant':
-                last_ai_msg = msg
-                break
-        
+        # 一次遍历取最后一条 AI 消息和 AI 消息总数
+        last_ai_msg, ai_msg_count = self.chat_manager.get_last_assistant_and_count()
         if not last_ai_msg:
             logger.info("generate_suggestions: 没有 AI 消息")
             return
-        
+
         # 获取角色配置
         persona = self.chat_manager.get_current_persona()
         scene_config = self.chat_manager.get_role_scene_config(persona.get('key', ''))
         scene_designs = scene_config.get('scene_designs', [])
-        
+
         # 判断是否是开场白回复（对话中只有一条 AI 消息且有场景设计）
-        ai_msg_count = sum(1 for msg in messages if msg.get('role') == 'assistant')
         has_scene = bool(scene_designs)
         is_opening_reply = ai_msg_count == 1 and has_scene
         
@@ -1606,10 +1712,9 @@ class MainWindow(QMainWindow):
         # 非开场白回复：使用 LLM 生成推荐
         logger.info("generate_suggestions: 开始 LLM 生成推荐")
         
-        # 如果已有推荐生成线程在运行，先停止
+        # 如果已有推荐生成任务在运行，先取消（结果不再发射）
         if self.suggestion_worker and self.suggestion_worker.isRunning():
-            self.suggestion_worker.quit()
-            self.suggestion_worker.wait(500)
+            self.suggestion_worker.cancel()
         
         # 显示加载状态
         self.chat_page.show_suggestion_loading()
@@ -1636,6 +1741,7 @@ class MainWindow(QMainWindow):
         self.suggestion_worker.finished.connect(on_generated)
         self.suggestion_worker.start()
     
+    @Slot()
     def start_ollama(self):
         """启动 Ollama"""
         self.set_notification("正在启动模型引擎...", "")
@@ -1673,27 +1779,64 @@ class MainWindow(QMainWindow):
                 self.settings_page.update_ollama_status(True, True)
                 self.set_notification("模型引擎已启动", "success")
                 
-                # 刷新模型列表
-                models = self.ollama.list_models()
-                self.chat_page.update_models(models)
-                self.refresh_settings_data()
+                # 刷新模型列表和设置页（去抖合并）
+                self._request_refresh()
             else:
                 self.set_notification(f"启动失败: {msg}", "error")
         else:
             self.set_notification("启动失败", "error")
     
+    @Slot()
     def refresh_status(self):
         """刷新状态"""
+        # 用户主动刷新时重新检测硬件（平时走 lru_cache 的缓存结果）
+        detect_hardware.cache_clear()
         self.refresh_settings_data()
-        
-        running = self.ollama.is_running()
-        installed = self.ollama.is_installed()
-        self.update_ollama_quick_status(installed, running)
-        if running:
-            models = self.ollama.list_models()
-            self.chat_page.update_models(models)
-        
+
+        # 侧边栏快捷状态走 Qt 异步网络探测，不在 GUI 线程做同步 socket 请求
+        self.probe_ollama_status()
+
         self.set_notification("已刷新状态", "")
+
+    def _request_refresh(self):
+        """请求一次模型列表+设置页刷新，150ms 窗口内的重复请求合并"""
+        self._refresh_timer.start()
+
+    @Slot()
+    def _do_refresh_all(self):
+        """统一刷新：取一次模型列表，同时更新聊天页和设置页"""
+        models = self.ollama.list_models()
+        self._models_cache = models
+        self.chat_page.update_models(models)
+        self.refresh_settings_data()
+
+    def probe_ollama_status(self):
+        """异步探测 Ollama 运行状态（探测完成后刷新快捷状态和模型列表）"""
+        request = QNetworkRequest(QUrl(f"{self.ollama.base_url}/api/tags"))
+        reply = self._qnam.get(request)
+        reply.finished.connect(lambda: self._on_ollama_probe_done(reply))
+
+    def _on_ollama_probe_done(self, reply: QNetworkReply):
+        """Ollama 状态探测完成"""
+        running = reply.error() == QNetworkReply.NetworkError.NoError
+        reply.deleteLater()
+
+        # is_installed 只是路径判空，可安全在 GUI 线程调用
+        self._schedule_ollama_quick_status(self.ollama.is_installed(), running)
+
+        if running:
+            # 模型列表仍是阻塞 HTTP 调用，放到线程池
+            self._models_worker = WorkerThread(self.ollama.list_models)
+            self._models_worker.finished.connect(self._on_models_listed)
+            self._models_worker.start()
+
+    @Slot(object)
+    def _on_models_listed(self, result):
+        """模型列表刷新完成"""
+        if isinstance(result, Exception):
+            return
+        self._models_cache = result or []
+        self.chat_page.update_models(self._models_cache)
     
     @Slot(str, str)
     def download_model(self, model_name: str, quantization: str = ''):
@@ -1709,68 +1852,110 @@ class MainWindow(QMainWindow):
         quant_info = f" ({quantization})" if quantization else ""
         self.set_notification(f"正在下载 {model_name}{quant_info}...", "")
         
-        self.download_start_time = datetime.now()
-        
-        def update_ui_progress(percent, msg):
-            """更新 UI 进度（线程安全）"""
-            from PySide6.QtCore import QMetaObject, Qt, Q_ARG
-            
-            # 计算剩余时间
-            elapsed = (datetime.now() - self.download_start_time).total_seconds()
-            if percent > 10 and elapsed > 0:
-                remaining = (elapsed / percent) * (100 - percent)
-                if remaining > 60:
-                    time_str = f" - 剩余约 {int(remaining / 60)} 分钟"
-                else:
-                    time_str = f" - 剩余约 {int(remaining)} 秒"
-                display_msg = f"{msg}{time_str}"
-            else:
-                display_msg = msg
-            
-            QMetaObject.invokeMethod(
-                self.settings_page,
-                "update_download_progress",
-                Qt.QueuedConnection,
-                Q_ARG(str, self.current_download_model),
-                Q_ARG(int, percent),
-                Q_ARG(str, display_msg)
-            )
-            QMetaObject.invokeMethod(
-                self,
-                "set_notification",
-                Qt.QueuedConnection,
-                Q_ARG(str, display_msg),
-                Q_ARG(str, "")
-            )
-        
-        def do_download():
-            # 下载模型（progress_callback 现在接收 percent 和 msg）
-            gguf_path, ollama_name, error = self.model_manager.download_model(
-                model_name, 
-                progress_callback=update_ui_progress,
-                quantization=quantization if quantization else None
-            )
-            
-            if error:
-                return False, error, None
-            
-            update_ui_progress(95, "正在导入到 Ollama...")
-            
-            # 导入到 Ollama
-            def ollama_progress(msg):
-                update_ui_progress(97, msg)
-            
-            success = self.ollama.create_model_from_gguf(ollama_name, gguf_path, ollama_progress)
-            
-            if success:
-                update_ui_progress(100, "安装完成!")
-                return True, model_name, ollama_name
+        self._download_t0 = time.monotonic()
+        self._dl_ema_rate = None  # 百分比/秒 的滑动平均
+        self._dl_last_percent = 0
+        self._dl_last_tick = self._download_t0
+        self._dl_last_display = None
+        self._dl_last_notif_t = 0.0
+        self._dl_emit_t = 0.0
+        self._dl_emit_percent = -1
+
+        # 绑定方法代替每次下载新建的三个闭包（少一批 cell 对象，
+        # 也便于单独测试）；节流状态放在实例属性上
+        worker = WorkerThread(self._do_download, model_name, quantization)
+        # 显式 QueuedConnection：发射固定经事件循环投递到主线程，
+        # 不会从工作线程直接重入 Qt
+        worker.progress.connect(self._on_download_progress, Qt.QueuedConnection)
+        worker.finished.connect(self.on_download_done)
+        # 下载任务单独持有：self.worker 随时会被状态检查/快速启动覆盖，
+        # 长下载期间经它回发会发到没人连接的信号上
+        self._download_worker = worker
+        worker.start()
+
+    def _report_download_progress(self, percent, msg):
+        """工作线程侧上报进度：按 ~4Hz 合并，完成帧必发
+
+        HTTP 分块到达的频率远高于事件循环能消化的速度，
+        每块都发信号会把主线程淹没在排队的进度更新里；
+        百分比没变时连格式化的必要都没有。
+        """
+        now = time.monotonic()
+        if percent < 100 and now - self._dl_emit_t < 0.25 and percent == self._dl_emit_percent:
+            return
+        self._dl_emit_t = now
+        self._dl_emit_percent = percent
+        self._download_worker.progress.emit(self.current_download_model, percent, msg)
+
+    def _ollama_import_progress(self, msg):
+        """Ollama 导入阶段的进度中转（固定 97%）"""
+        self._report_download_progress(97, msg)
+
+    def _do_download(self, model_name, quantization):
+        """下载 + 导入 Ollama（线程池中运行）"""
+        gguf_path, ollama_name, error = self.model_manager.download_model(
+            model_name,
+            progress_callback=self._report_download_progress,
+            quantization=quantization if quantization else None,
+            cancel_check=lambda: self._download_worker.is_cancelled
+        )
+
+        if error:
+            return False, error, None
+
+        self._report_download_progress(95, "正在导入到 Ollama...")
+
+        success = self.ollama.create_model_from_gguf(ollama_name, gguf_path, self._ollama_import_progress)
+
+        if success:
+            self._report_download_progress(100, "安装完成!")
+            return True, model_name, ollama_name
+        else:
+            return False, "导入 Ollama 失败", None
+
+    @Slot(str, int, str)
+    def _on_download_progress(self, model_name: str, percent: int, msg: str):
+        """下载进度更新（主线程执行）
+
+        剩余时间用指数滑动平均估算：瞬时速率抖动大，直接显示会让
+        数字来回跳；显示串没变化时跳过 UI 更新。
+        """
+        now = time.monotonic()
+        if percent > self._dl_last_percent and now > self._dl_last_tick:
+            instant = (percent - self._dl_last_percent) / (now - self._dl_last_tick)
+            if self._dl_ema_rate is None:
+                self._dl_ema_rate = instant
             else:
-                return False, "导入 Ollama 失败", None
-        
-        self.worker = WorkerThread(do_download)
-        self.worker.finished.connect(self.on_download_done)
-        self.worker.start()
+                self._dl_ema_rate = 0.3 * instant + 0.7 * self._dl_ema_rate
+            self._dl_last_percent = percent
+            self._dl_last_tick = now
+
+        if percent > 10 and self._dl_ema_rate:
+            remaining = int((100 - percent) / max(self._dl_ema_rate, 1e-6))
+            is_min = remaining >= 60
+            disp = remaining // 60 if is_min else remaining
+        else:
+            is_min = None
+            disp = None
+
+        # 先比显示值（百分比、消息、剩余时间的显示数字），未变化时
+        # 直接返回，连格式化字符串都不构建
+        key = (percent, msg, disp, is_min)
+        if key == self._dl_last_display and percent < 100:
+            return
+        self._dl_last_display = key
+
+        if disp is not None:
+            display_msg = ("%s - 剩余约 %d 分钟" if is_min else "%s - 剩余约 %d 秒") % (msg, disp)
+        else:
+            display_msg = msg
+
+        self.settings_page.update_download_progress(model_name, percent, display_msg)
+
+        # 侧边栏通知只是对设置页进度卡的冗余播报，降到 1Hz（完成帧必发）
+        if percent >= 100 or now - self._dl_last_notif_t > 1.0:
+            self._dl_last_notif_t = now
+            self.set_notification(display_msg, "")
 
     @Slot(object)
     def on_download_done(self, result):
@@ -1789,12 +1974,13 @@ class MainWindow(QMainWindow):
             if success:
                 self.set_notification(f"✅ {msg} 安装成功!", "success")
                 
-                # 重要：先刷新模型列表
+                # 重要：先刷新模型列表（set_model 依赖下拉框已更新，保持同步执行）
                 models = self.ollama.list_models()
+                self._models_cache = models
                 self.chat_page.update_models(models)
                 
-                # 刷新设置页面（这会重新渲染模型卡片）
-                self.refresh_settings_data()
+                # 刷新设置页面（这会重新渲染模型卡片，去抖合并）
+                self._request_refresh()
                 
                 # 通知设置页面下载完成
                 self.settings_page.finish_download(model_name, True)
@@ -1814,19 +2000,31 @@ class MainWindow(QMainWindow):
         self.current_download_model = None
         self.current_download_quant = None
 
+    def _norm_model_index(self, models: list) -> dict:
+        """归一化名 -> 实际 Ollama 名 的索引，模型列表对象更换时重建"""
+        cached = self._models_norm_index
+        if cached is not None and cached[0] is models:
+            return cached[1]
+        index = {m['name'].split(':')[0].lower().translate(_MODEL_NORM_TBL): m['name']
+                 for m in models}
+        self._models_norm_index = (models, index)
+        return index
+
     @Slot(str)
     def load_model(self, model_name):
         """加载模型"""
-        # 查找实际的 Ollama 模型名
-        models = self.ollama.list_models()
-        actual_name = None
-        
-        simple_name = model_name.lower().replace('-', '').replace('.', '')
-        for m in models:
-            m_simple = m['name'].split(':')[0].lower().replace('-', '').replace('.', '')
-            if simple_name in m_simple or m_simple in simple_name:
-                actual_name = m['name']
-                break
+        # 查找实际的 Ollama 模型名（优先用缓存列表）
+        models = self._models_cache or self.ollama.list_models()
+
+        simple_name = model_name.lower().translate(_MODEL_NORM_TBL)
+        index = self._norm_model_index(models)
+        actual_name = index.get(simple_name)
+        if actual_name is None:
+            # 回退：双向子串匹配（键已经归一化，不再逐个 replace）
+            for m_simple, name in index.items():
+                if simple_name in m_simple or m_simple in simple_name:
+                    actual_name = name
+                    break
         
         if actual_name:
             self.chat_manager.set_model(actual_name)
@@ -1837,18 +2035,18 @@ class MainWindow(QMainWindow):
         else:
             self.set_notification(f"未找到模型: {model_name}", "error")
     
-    @Slot(str)
-    def uninstall_model(self, model_name: str):
-        """卸载模型（包括删除 GGUF 文件）"""
-        # 创建自定义对话框
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-        from PySide6.QtCore import Qt
-        from PySide6.QtGui import QFont
-        
+    def _build_uninstall_dialog(self):
+        """构建卸载确认对话框（只执行一次，之后复用）
+
+        对话框除模型名外完全相同，没必要每次卸载都重建 8 个子部件、
+        重新解析 4 段 QSS；主题切换时由 apply_theme 丢弃重建。
+        """
         dialog = QDialog(self)
         dialog.setWindowTitle("确认卸载")
         dialog.setFixedWidth(450)
         dialog.setModal(True)
+        # 构建子部件期间不触发重绘/几何传播，显示前统一恢复
+        dialog.setUpdatesEnabled(False)
         
         c = self.theme.colors
         dialog.setStyleSheet(f"""
@@ -1867,25 +2065,25 @@ class MainWindow(QMainWindow):
         title_layout.setSpacing(12)
         
         icon_label = QLabel("⚠️")
-        icon_label.setFont(QFont("Segoe UI Emoji", 32))
+        icon_label.setFont(_FONT_EMOJI_32)
         title_layout.addWidget(icon_label)
         
         title_text = QLabel("确认卸载模型")
-        title_text.setFont(QFont("Microsoft YaHei UI", 16, QFont.Bold))
+        title_text.setFont(_FONT_TITLE_16)
         title_text.setStyleSheet(f"color: {c['text']};")
         title_layout.addWidget(title_text, 1)
         
         layout.addLayout(title_layout)
         
-        # 模型名称
-        model_label = QLabel(f"模型：{model_name}")
-        model_label.setFont(QFont("Microsoft YaHei UI", 13, QFont.Bold))
+        # 模型名称（占位文本，每次显示前由 uninstall_model 更新）
+        model_label = QLabel("")
+        model_label.setFont(_FONT_BTN)
         model_label.setStyleSheet(f"color: {c['accent']}; padding: 10px; background-color: {c['bg_tertiary']}; border-radius: 8px;")
         layout.addWidget(model_label)
         
         # 提示信息
         message = QLabel("这将同时删除：\n• Ollama 中的模型\n• 对应的 GGUF 文件\n\n卸载后需要重新下载才能使用。")
-        message.setFont(QFont("Microsoft YaHei UI", 11))
+        message.setFont(_FONT_LABEL_11)
         message.setStyleSheet(f"color: {c['text_secondary']}; line-height: 1.8;")
         message.setWordWrap(True)
         layout.addWidget(message)
@@ -1898,7 +2096,7 @@ class MainWindow(QMainWindow):
         cancel_btn = QPushButton("取消")
         cancel_btn.setFixedSize(100, 40)
         cancel_btn.setCursor(Qt.PointingHandCursor)
-        cancel_btn.setFont(QFont("Microsoft YaHei UI", 12))
+        cancel_btn.setFont(_FONT_LABEL_12)
         cancel_btn.setStyleSheet(f"""
             QPushButton {{
                 background-color: {c['bg_tertiary']};
@@ -1918,7 +2116,7 @@ class MainWindow(QMainWindow):
         uninstall_btn = QPushButton("卸载")
         uninstall_btn.setFixedSize(100, 40)
         uninstall_btn.setCursor(Qt.PointingHandCursor)
-        uninstall_btn.setFont(QFont("Microsoft YaHei UI", 12, QFont.Bold))
+        uninstall_btn.setFont(_FONT_BTN_BOLD_12)
         uninstall_btn.setStyleSheet(f"""
             QPushButton {{
                 background-color: {c['error']};
@@ -1935,9 +2133,19 @@ class MainWindow(QMainWindow):
         button_layout.addWidget(uninstall_btn)
         
         layout.addLayout(button_layout)
-        
-        # 显示对话框
-        if dialog.exec() == QDialog.Accepted:
+
+        dialog.setUpdatesEnabled(True)
+        self._uninstall_dialog = dialog
+        self._uninstall_model_label = model_label
+
+    @Slot(str)
+    def uninstall_model(self, model_name: str):
+        """卸载模型（包括删除 GGUF 文件）"""
+        if self._uninstall_dialog is None:
+            self._build_uninstall_dialog()
+
+        self._uninstall_model_label.setText(f"模型：{model_name}")
+        if self._uninstall_dialog.exec() == QDialog.Accepted:
             self.set_notification(f"正在卸载 {model_name}...", "")
             
             # 1. 从下载记录中获取完整的 ollama 名称
@@ -1946,137 +2154,168 @@ class MainWindow(QMainWindow):
             if not record:
                 self.set_notification("❌ 未找到模型记录", "error")
                 return
+
+            # 删除 Ollama 模型和多 GB 的模型目录可能要耗时数秒，
+            # 放到线程池执行，完成后回主线程刷新界面
+            self._uninstall_worker = WorkerThread(self._do_uninstall, record, model_name)
+            self._uninstall_worker.finished.connect(self._on_uninstall_done)
+            self._uninstall_worker.start()
+
+    def _do_uninstall(self, record: dict, model_name: str):
+        """执行卸载（线程池中运行）：删 Ollama 模型、模型目录和下载记录"""
+        ollama_name = record.get('ollama_name', '')
+        gguf_path = record.get('gguf_path', '')
+        quantization = record.get('quantization', '')
+        
+        logger.debug("[卸载] 精简名称: %s", model_name)
+        logger.debug("[卸载] 记录中的Ollama名称: %s", ollama_name)
+        logger.debug("[卸载] GGUF路径: %s", gguf_path)
+        logger.debug("[卸载] 量化版本: %s", quantization)
+        
+        # 2. 从 Ollama 中删除模型
+        ollama_deleted = False
+        
+        # 获取 Ollama 中所有模型，找到匹配的
+        if self.ollama.is_running():
+            ollama_models = self.ollama.list_models()
+            logger.debug("[卸载] Ollama中的模型列表: %s", [m.get('name', '') for m in ollama_models])
             
-            ollama_name = record.get('ollama_name', '')
-            gguf_path = record.get('gguf_path', '')
-            quantization = record.get('quantization', '')
-            
-            print(f"[卸载] 精简名称: {model_name}")
-            print(f"[卸载] 记录中的Ollama名称: {ollama_name}")
-            print(f"[卸载] GGUF路径: {gguf_path}")
-            print(f"[卸载] 量化版本: {quantization}")
-            
-            # 2. 从 Ollama 中删除模型
-            ollama_deleted = False
-            
-            # 获取 Ollama 中所有模型，找到匹配的
-            if self.ollama.is_running():
-                ollama_models = self.ollama.list_models()
-                print(f"[卸载] Ollama中的模型列表: {[m.get('name', '') for m in ollama_models]}")
-                
-                # 尝试多种匹配方式
-                possible_names = []
-                
-                # 1. 使用记录中的名称
-                if ollama_name:
-                    possible_names.append(ollama_name)
-                    if ':' not in ollama_name:
-                        possible_names.append(f"{ollama_name}:latest")
-                
-                # 2. 使用标准格式：模型名-量化版本
-                if quantization:
-                    standard_name = f"{model_name}-{quantization}"
-                    possible_names.append(standard_name)
-                    possible_names.append(f"{standard_name}:latest")
-                    # 尝试小写
-                    possible_names.append(standard_name.lower())
-                    possible_names.append(f"{standard_name.lower()}:latest")
-                
-                # 3. 在 Ollama 模型列表中查找匹配
-                for ollama_model in ollama_models:
-                    ollama_model_name = ollama_model.get('name', '')
-                    # 检查是否匹配（不区分大小写）
-                    if any(pn.lower() == ollama_model_name.lower() for pn in possible_names):
-                        print(f"[卸载] 找到匹配的模型: {ollama_model_name}")
-                        if self.ollama.delete_model(ollama_model_name):
-                            ollama_deleted = True
-                            print(f"[卸载] ✅ 成功删除 Ollama 模型: {ollama_model_name}")
-                            break
-                    # 也检查模型名称是否包含精简名称和量化版本
-                    elif model_name.lower() in ollama_model_name.lower() and quantization.lower() in ollama_model_name.lower():
-                        print(f"[卸载] 通过模糊匹配找到模型: {ollama_model_name}")
-                        if self.ollama.delete_model(ollama_model_name):
-                            ollama_deleted = True
-                            print(f"[卸载] ✅ 成功删除 Ollama 模型: {ollama_model_name}")
-                            break
-                
-                if not ollama_deleted:
-                    print(f"[卸载] ⚠️ 未找到匹配的 Ollama 模型")
-            else:
-                print(f"[卸载] ⚠️ Ollama 服务未运行，跳过模型删除")
+            # 尝试多种匹配方式（候选名和模型名都只小写一次）
+            possible_names = set()
+
+            # 1. 使用记录中的名称
+            if ollama_name:
+                possible_names.add(ollama_name.lower())
+                if ':' not in ollama_name:
+                    possible_names.add(f"{ollama_name.lower()}:latest")
+
+            # 2. 使用标准格式：模型名-量化版本
+            if quantization:
+                standard_name = f"{model_name}-{quantization}".lower()
+                possible_names.add(standard_name)
+                possible_names.add(f"{standard_name}:latest")
+
+            model_name_l = model_name.lower()
+            quant_l = quantization.lower()
+
+            # 3. 在 Ollama 模型列表中查找匹配：先精确命中，再模糊回退
+            for ollama_model in ollama_models:
+                ollama_model_name = ollama_model.get('name', '')
+                name_l = ollama_model_name.lower()
+                # 检查是否匹配（不区分大小写）
+                if name_l in possible_names:
+                    logger.debug("[卸载] 找到匹配的模型: %s", ollama_model_name)
+                    if self.ollama.delete_model(ollama_model_name):
+                        ollama_deleted = True
+                        logger.info("[卸载] 成功删除 Ollama 模型: %s", ollama_model_name)
+                        break
+                # 也检查模型名称是否包含精简名称和量化版本
+                elif model_name_l in name_l and quant_l in name_l:
+                    logger.debug("[卸载] 通过模糊匹配找到模型: %s", ollama_model_name)
+                    if self.ollama.delete_model(ollama_model_name):
+                        ollama_deleted = True
+                        logger.info("[卸载] 成功删除 Ollama 模型: %s", ollama_model_name)
+                        break
             
-            # 3. 删除模型目录（包括 GGUF 文件和临时文件）
-            gguf_deleted = False
-            if gguf_path:
-                import shutil
-                # 获取模型目录
-                model_dir = os.path.dirname(gguf_path)
-                models_base = self.model_manager.models_dir
-                
-                # 确保目录在 models 目录下，防止误删
-                if model_dir and models_base in model_dir and os.path.exists(model_dir):
-                    try:
-                        shutil.rmtree(model_dir)
-                        gguf_deleted = True
-                        print(f"[卸载] ✅ 成功删除模型目录: {model_dir}")
-                    except Exception as e:
-                        print(f"[卸载] ⚠️ 删除模型目录失败: {e}")
-                        # 回退到只删除 gguf 文件
-                        if os.path.exists(gguf_path):
-                            try:
-                                os.remove(gguf_path)
-                                gguf_deleted = True
-                                print(f"[卸载] ✅ 回退：成功删除 GGUF 文件: {gguf_path}")
-                            except Exception as e2:
-                                print(f"[卸载] ⚠️ 删除 GGUF 文件也失败: {e2}")
-                elif gguf_path and os.path.exists(gguf_path):
-                    # 目录不在 models 下，只删除 gguf 文件
+            if not ollama_deleted:
+                logger.warning("[卸载] 未找到匹配的 Ollama 模型")
+        else:
+            logger.warning("[卸载] Ollama 服务未运行，跳过模型删除")
+        
+        # 3. 删除模型目录（包括 GGUF 文件和临时文件）
+        gguf_deleted = False
+        if gguf_path:
+            model_dir = Path(gguf_path).parent
+            models_base = Path(self.model_manager.models_dir)
+
+            # 确保目录在 models 目录下，防止误删：用路径前缀比较而不是
+            # 子串包含（前缀相近的目录名会误判）；不预先 stat，目录不存在
+            # 由 rmtree 的 FileNotFoundError 兜住
+            if model_dir.is_relative_to(models_base):
+                try:
+                    shutil.rmtree(model_dir)
+                    gguf_deleted = True
+                    logger.info("[卸载] 成功删除模型目录: %s", model_dir)
+                except FileNotFoundError:
+                    logger.warning("[卸载] 模型目录不存在: %s", model_dir)
+                except OSError as e:
+                    logger.warning("[卸载] 删除模型目录失败: %s", e)
+                    # 回退到只删除 gguf 文件
                     try:
                         os.remove(gguf_path)
                         gguf_deleted = True
-                        print(f"[卸载] ✅ 成功删除 GGUF 文件: {gguf_path}")
-                    except Exception as e:
-                        print(f"[卸载] ⚠️ 删除 GGUF 文件失败: {e}")
-            
-            # 4. 删除下载记录
-            record_key = record.get('record_key', '')
-            if record_key:
-                self.model_manager.remove_download_record(record_key)
-                print(f"[卸载] ✅ 已删除下载记录: {record_key}")
-            
-            # 汇总结果
-            if ollama_deleted or gguf_deleted:
-                msg_parts = []
-                if ollama_deleted:
-                    msg_parts.append("Ollama 模型")
-                if gguf_deleted:
-                    msg_parts.append("GGUF 文件")
-                
-                self.set_notification(f"✅ 已卸载: {', '.join(msg_parts)}", "success")
-                
-                # 刷新界面
-                self.refresh_settings_data()
-                
-                # 刷新聊天页面的模型列表
-                models = self.ollama.list_models()
-                self.chat_page.update_models(models)
+                        logger.info("[卸载] 回退：成功删除 GGUF 文件: %s", gguf_path)
+                    except OSError as e2:
+                        logger.warning("[卸载] 删除 GGUF 文件也失败: %s", e2)
             else:
-                self.set_notification("❌ 卸载失败，未找到相关文件", "error")
+                # 目录不在 models 下，只删除 gguf 文件
+                try:
+                    os.remove(gguf_path)
+                    gguf_deleted = True
+                    logger.info("[卸载] 成功删除 GGUF 文件: %s", gguf_path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning("[卸载] 删除 GGUF 文件失败: %s", e)
+        
+        # 4. 删除下载记录
+        record_key = record.get('record_key', '')
+        if record_key:
+            self.model_manager.remove_download_record(record_key)
+            logger.info("[卸载] 已删除下载记录: %s", record_key)
+        
+        return ollama_deleted, gguf_deleted
+
+    @Slot(object)
+    def _on_uninstall_done(self, result):
+        """卸载完成（主线程）：汇总结果并刷新界面"""
+        if isinstance(result, Exception):
+            self.set_notification(f"❌ 卸载失败: {result}", "error")
+            return
+
+        ollama_deleted, gguf_deleted = result
+        if ollama_deleted or gguf_deleted:
+            msg_parts = []
+            if ollama_deleted:
+                msg_parts.append("Ollama 模型")
+            if gguf_deleted:
+                msg_parts.append("GGUF 文件")
+
+            self.set_notification(f"✅ 已卸载: {', '.join(msg_parts)}", "success")
+
+            # 刷新设置页和聊天页模型列表（去抖合并）
+            self._request_refresh()
+        else:
+            self.set_notification("❌ 卸载失败，未找到相关文件", "error")
 
     @Slot(str)
     def on_theme_setting_changed(self, theme_name):
         """主题设置更改"""
         self.set_notification(f"已切换到{self.theme.current['display_name']}主题", "")
     
+    @Slot()
+    @Slot(dict)
     def apply_theme(self, theme=None):
         """应用主题样式"""
+        # 主题未变化时整段跳过：每个 setStyleSheet 都会重新解析 QSS
+        # 并触发子树样式重算，重复应用同一主题纯属浪费
+        theme_name = self.theme.current.get('name')
+        if self._window_theme_name == theme_name:
+            return
+        self._window_theme_name = theme_name
+
         c = self.theme.colors
-        
-        # 主窗口背景
-        self.setStyleSheet(f"background-color: {c['bg']};")
-        
+
+        # 主窗口背景由全局样式表（on_theme_changed）统一设置，
+        # 这里不再额外 setStyleSheet 触发第二次整树 re-polish
+
+        # 卸载确认弹窗按旧主题构建，丢弃后下次使用时重建
+        if self._uninstall_dialog is not None:
+            self._uninstall_dialog.deleteLater()
+            self._uninstall_dialog = None
+
         # 侧边栏样式
-        if hasattr(self, 'sidebar'):
+        if self.sidebar is not None:
             self.sidebar.setStyleSheet(f"""
                 QFrame#sidebar {{
                     background-color: {c['sidebar_bg']};
@@ -2092,7 +2331,7 @@ class MainWindow(QMainWindow):
             """)
         
         # 新建对话按钮
-        if hasattr(self, 'new_chat_btn'):
+        if self.new_chat_btn is not None:
             self.new_chat_btn.setStyleSheet(f"""
                 QPushButton {{
                     background-color: {c['accent']};
@@ -2106,7 +2345,7 @@ class MainWindow(QMainWindow):
             """)
         
         # 角色对话按钮
-        if hasattr(self, 'role_chat_btn'):
+        if self.role_chat_btn is not None:
             self.role_chat_btn.setStyleSheet(f"""
                 QPushButton {{
                     background-color: {c['card_bg']};
@@ -2122,74 +2361,62 @@ class MainWindow(QMainWindow):
             """)
         
         # 历史记录标题
-        if hasattr(self, 'history_title'):
+        if self.history_title is not None:
             self.history_title.setStyleSheet(f"color: {c['text_secondary']};")
         
         # 通知栏
-        if hasattr(self, 'notification'):
+        if self.notification is not None:
             self.notification.setStyleSheet(f"""
                 background-color: {c['notification_bg']};
                 border-top: 1px solid {c['border']};
             """)
         
-        if hasattr(self, 'notification_label'):
+        if self.notification_label is not None:
             self.notification_label.setStyleSheet(f"color: {c['text']};")
-        
-        # 更新 Ollama 快捷按钮样式
-        if hasattr(self, 'ollama_status_label'):
-            self.update_ollama_quick_status(
-                self.ollama.is_installed(),
-                self.ollama.is_running()
-            )
+
+        # Ollama 快捷按钮样式：用缓存状态按新主题重刷，不再为换肤
+        # 发起 is_installed/is_running 探测；状态未知时等启动检测回报
+        if self.ollama_status_label is not None:
+            state = self._last_ollama_state
+            if state is not None:
+                self._last_ollama_state = None  # 强制按新样式重新应用
+                self.update_ollama_quick_status(*state)
     
     def resizeEvent(self, event):
         """窗口大小改变事件 - 更新背景图片"""
         super().resizeEvent(event)
         
         # 窗口大小改变时，更新聊天背景
-        if hasattr(self, 'chat_page'):
+        if self.chat_page is not None:
             self.chat_page.update_background_on_resize()
     
-    def eventFilter(self, obj, event):
-        """事件过滤器 - 捕获双击空白处"""
-        from PySide6.QtCore import QEvent, QTime
-        from PySide6.QtWidgets import QPushButton, QLabel, QScrollArea
-        
-        if event.type() == QEvent.MouseButtonDblClick:
-            # 获取点击的控件
-            widget = self.childAt(event.pos())
-            
-            # 如果点击的是空白区域（背景或容器）
-            if widget is None or isinstance(widget, (QWidget, QFrame)) and not isinstance(widget, (QPushButton, QLabel, QScrollArea)):
-                # 切换角色对话按钮的可见性
-                self.role_chat_btn.setVisible(not self.role_chat_btn.isVisible())
-                return True
-        
-        return super().eventFilter(obj, event)
+    def mouseDoubleClickEvent(self, event):
+        """双击空白处切换角色对话按钮的可见性
+
+        用虚函数重写代替 installEventFilter(self)：事件过滤器会把窗口的
+        每个事件都绕进 Python 一次，这里只有双击需要进解释器。
+        """
+        # 获取点击的控件
+        widget = self.childAt(event.position().toPoint())
+
+        # 如果点击的是空白区域（背景或容器）
+        if widget is None or isinstance(widget, (QWidget, QFrame)) and not isinstance(widget, (QPushButton, QLabel, QScrollArea)):
+            # 切换角色对话按钮的可见性
+            self.role_chat_btn.setVisible(not self.role_chat_btn.isVisible())
+            event.accept()
+            return
+
+        super().mouseDoubleClickEvent(event)
 
     @Slot(str, str)
     def set_notification(self, text: str, level: str = "info"):
         """设置通知"""
         c = self.theme.colors
-        colors = {
-            "info": c['text_secondary'],
-            "success": c['success'],
-            "warning": c['warning'],
-            "error": c['error']
-        }
-        color = colors.get(level, c['text_secondary'])
-        
-        # 添加图标
-        icons = {
-            "info": "ℹ️",
-            "success": "✅",
-            "warning": "⚠️",
-            "error": "❌"
-        }
-        icon = icons.get(level, "")
-        
+        color = c[_NOTIF_COLOR_KEYS.get(level, "text_secondary")]
+        icon = _NOTIF_ICONS.get(level, "")
+
         # 如果消息本身已经包含图标，就不添加
-        if any(emoji in text for emoji in ["✅", "❌", "⚠️", "ℹ️", "🚀", "📥", "📊"]):
+        if _NOTIF_EMOJI_RE.search(text) is not None:
             display_text = text
         else:
             display_text = f"{icon} {text}" if icon else text
@@ -2199,28 +2426,14 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """关闭事件 - 确保所有后台线程和进程都被终止"""
-        import os
-        import signal
-        
         logger.info("[退出] 开始清理资源...")
         
-        # 收集所有需要停止的线程
-        workers = [
-            ('worker', self.worker if hasattr(self, 'worker') else None),
-            ('chat_worker', self.chat_worker if hasattr(self, 'chat_worker') else None),
-            ('suggestion_worker', self.suggestion_worker if hasattr(self, 'suggestion_worker') else None),
-        ]
-        
-        # 停止所有后台线程
-        for name, worker in workers:
-            if worker and worker.isRunning():
-                logger.info(f"[退出] 停止线程: {name}")
-                worker.cancel()  # 标记取消
-                worker.quit()
-                if not worker.wait(1500):  # 等待 1.5 秒
-                    logger.warning(f"[退出] 线程 {name} 未能正常退出，强制终止")
-                    worker.terminate()
-                    worker.wait(500)
+        # 先统一标记取消（登记表覆盖所有在飞任务，不限于具名 worker），
+        # 再用一次有界等待收尾：总耗时由最慢任务决定，而不是逐个相加
+        for worker in list(WorkerThread._active):
+            worker.cancel()
+        if not WorkerThread.pool().waitForDone(2000):
+            logger.warning("[退出] 仍有后台任务未结束，不再等待")
         
         # 停止 Ollama 服务
         logger.info("[退出] 停止 Ollama 服务")
@@ -2231,7 +2444,7 @@ class MainWindow(QMainWindow):
         
         # 关闭数据库连接
         logger.info("[退出] 关闭数据库连接")
-        if hasattr(self, 'chat_manager') and self.chat_manager:
+        if self.chat_manager:
             try:
                 self.chat_manager.db.close()
             except Exception as e:
@@ -2251,8 +2464,7 @@ class MainWindow(QMainWindow):
 
 def main():
     from PySide6.QtWidgets import QApplication
-    from PySide6.QtGui import QIcon
-    
+
     # Windows 任务栏图标：设置 AppUserModelID（必须在创建 QApplication 之前）
     if sys.platform == 'win32':
         try:
@@ -2260,7 +2472,7 @@ def main():
             # 设置唯一的 AppUserModelID，让 Windows 正确显示任务栏图标
             ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID('LocalLLM.AIAssistant.1.0')
         except Exception as e:
-            print(f"[DEBUG] 设置 AppUserModelID 失败: {e}")
+            logger.debug("设置 AppUserModelID 失败: %s", e)
     
     app = QApplication(sys.argv)
     
@@ -2268,30 +2480,18 @@ def main():
     app.setOrganizationName("LocalLLM")
     
     # 设置应用图标（Windows 任务栏需要在 QApplication 级别设置）
-    icon_path = None
-    
-    if getattr(sys, 'frozen', False):
-        # 打包后：优先从 _MEIPASS 获取
-        meipass = getattr(sys, '_MEIPASS', None)
-        if meipass:
-            icon_path = os.path.join(meipass, "icon.ico")
-        
-        # 如果 _MEIPASS 中没有，尝试 exe 同级目录
-        if not icon_path or not os.path.exists(icon_path):
-            icon_path = os.path.join(os.path.dirname(sys.executable), "icon.ico")
-    else:
-        # 开发环境
-        icon_path = os.path.join(BASE_DIR, "icon.ico")
-    
-    if icon_path and os.path.exists(icon_path):
-        app.setWindowIcon(QIcon(icon_path))
-        print(f"[DEBUG] 应用图标已设置: {icon_path}")
-    else:
-        print(f"[DEBUG] 应用图标未找到: {icon_path}")
+    icon = MainWindow.app_icon()
+    if not icon.isNull():
+        app.setWindowIcon(icon)
     
     window = MainWindow()
     window.show()
-    
+
+    if QtAsyncio is not None:
+        # QtAsyncio 合并 Qt 与 asyncio 事件循环，支持协程任务
+        QtAsyncio.run(handle_sigint=True)
+        sys.exit(0)
+
     sys.exit(app.exec())
 
 
@@ -5,15 +5,99 @@
 import math
 import os
 from PySide6.QtWidgets import QWidget, QPushButton, QLabel, QVBoxLayout
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QTimer, QPoint, QSize
-from PySide6.QtGui import QFont, QPixmap, QPainter, QTransform
+from PySide6.QtCore import Qt, Signal, Property, QPropertyAnimation, QEasingCurve, QTimer, QPoint, QSize
+from PySide6.QtGui import QFont, QPixmap, QPixmapCache, QPainter, QTransform, QColor, QLinearGradient, QBrush
 
+from core.media_manager import get_media_manager
 from .themes import get_theme_manager
 
+# 放大缓存上限（KB）：头像缩放结果要跨卡片、跨动画帧复用
+QPixmapCache.setCacheLimit(40960)
+
+# QFont 构建要查询字体数据库，动画路径上按 (字号, 字重) 复用；
+# 缩放桶化后字号只有十来个取值
+_FONT_CACHE = {}
+
+
+def _font(family: str, size: int, weight: int = -1) -> QFont:
+    """取缓存的 QFont（未命中时构建一次）"""
+    key = (family, size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = QFont(family, size) if weight < 0 else QFont(family, size, weight)
+        _FONT_CACHE[key] = font
+    return font
+
+
+def _get_scaled_pixmap(abs_path: str, width: int, height: int, source: QPixmap = None,
+                       smooth: bool = True) -> QPixmap:
+    """按 (路径, 目标尺寸, 插值模式) 缓存缩放+裁剪结果
+
+    平滑缩放和中心裁剪是旋转动画里最贵的 CPU 工作（每帧 × 每张可见
+    卡片），同一尺寸只算一次，之后直接命中 QPixmapCache。
+    动画途中可以用 smooth=False 走最近邻插值（旋转中肉眼看不出
+    锯齿），静止帧再换回平滑结果。
+    调用方可传入已解码的源图（缓存未命中时省一次磁盘读+解码）；
+    加载失败时返回空 QPixmap（不缓存）。
+    """
+    key = f"{abs_path}|{width}x{height}|{'s' if smooth else 'f'}"
+    cached = QPixmapCache.find(key)
+    if cached is not None and not cached.isNull():
+        return cached
+
+    if source is None:
+        source = QPixmap(abs_path)
+    if source.isNull():
+        return source
+
+    # 横向填满，保持比例。不再 copy() 做中心裁剪：头像 QLabel 是
+    # AlignCenter + 固定 geometry，超出部分由控件矩形自动裁掉，
+    # 效果等同中心裁剪，省一次整图分配和 memcpy
+    scaled = source.scaled(
+        width, height,
+        Qt.KeepAspectRatioByExpanding,
+        Qt.SmoothTransformation if smooth else Qt.FastTransformation
+    )
+
+    QPixmapCache.insert(key, scaled)
+    return scaled
+
+
+def _name_bar_pixmap(start: QColor, end: QColor, width: int, height: int, radius: int) -> QPixmap:
+    """预渲染名称条的横向渐变（底部圆角），按颜色+尺寸缓存
+
+    qlineargradient 写在 QSS 里每次 paint 都要重新栅格化；预渲染成
+    QPixmap 后每帧只剩一次 drawPixmap 贴图。
+    """
+    key = f"bar|{start.rgba()}|{end.rgba()}|{width}x{height}|{radius}"
+    cached = QPixmapCache.find(key)
+    if cached is not None and not cached.isNull():
+        return cached
+
+    pm = QPixmap(width, height)
+    pm.fill(Qt.transparent)
+    grad = QLinearGradient(0, 0, width, 0)
+    grad.setColorAt(0, start)
+    grad.setColorAt(1, end)
+    painter = QPainter(pm)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QBrush(grad))
+    # 圆角矩形向上越界 radius：上圆角被画布裁掉，只留底部圆角
+    painter.drawRoundedRect(0, -radius, width, height + radius, radius, radius)
+    painter.end()
+
+    QPixmapCache.insert(key, pm)
+    return pm
+
 
 class CarouselCard(QPushButton):
     """旋转木马卡片 - 方案2：渐变背景风格"""
-    
+
+    # (主题名, 是否中心, 透明度桶) -> (卡片, 头像, 名称条, 名称文字) QSS
+    # 透明度已量化到 1/16 桶，键空间很小；所有卡片实例共享
+    _qss_cache = {}
+
     def __init__(self, key: str, persona: dict, parent=None):
         super().__init__(parent)
         self.key = key
@@ -21,59 +105,67 @@ class CarouselCard(QPushButton):
         self.scale_factor = 1.0
         self.opacity_value = 1.0
         self.z_order = 0
+        self._last_transform_key = None  # 上次应用的变换，相同时整段跳过
+        self._last_layout = None  # 上一帧的 (x, y, scale, opacity, is_center)
+        self._is_visible = False  # 可见性影子状态，只在翻转时调用 setVisible
+        self._last_stack = None  # 上次的层叠目标（True=顶层 / 中心卡索引）
         self.theme = get_theme_manager()
-        
+
+        self._resolve_icon()
+
         # 初始尺寸（会在 set_transform 中动态调整）
         self.setFixedSize(160, 220)
         self.setCursor(Qt.PointingHandCursor)
-        
+
         self.setup_ui()
+
+    def _resolve_icon(self):
+        """解析并解码头像源图（只在绑定助手时执行一次，不进动画路径）"""
+        self._icon_abs_path = ""
+        self._source_pm = None
+        icon_path = self.persona.get("icon_path", "")
+        if icon_path:
+            abs_path = get_media_manager().get_absolute_path(icon_path)
+            if os.path.exists(abs_path):
+                pm = QPixmap(abs_path)
+                if not pm.isNull():
+                    self._icon_abs_path = abs_path
+                    self._source_pm = pm
+
+    def _apply_icon(self):
+        """按当前绑定的助手刷新头像区（初始 160x180 尺寸）"""
+        if self._source_pm is not None:
+            # 卡片头像区域尺寸，缩放结果走 QPixmapCache
+            scaled_pixmap = _get_scaled_pixmap(self._icon_abs_path, 160, 180, self._source_pm)
+            self.icon_label.setText("")
+            self.icon_label.setPixmap(scaled_pixmap)
+            self.icon_label.setScaledContents(False)  # 已裁剪好，不需要拉伸
+        else:
+            self.icon_label.setPixmap(QPixmap())
+            self.icon_label.setScaledContents(False)
+            self.icon_label.setText(self.persona.get("icon", "🤖"))
+            self.icon_label.setFont(_font("Segoe UI Emoji", 72))
+
+    def bind(self, key: str, persona: dict):
+        """把现有卡片重新绑定到另一个助手（复用控件，不重建）"""
+        self.key = key
+        self.persona = persona
+        self._last_transform_key = None
+        self._last_layout = None
+        self._last_stack = None
+        self._resolve_icon()
+        self._apply_icon()
+        self.name_label.setText(persona.get("name", "未知"))
     
     def setup_ui(self):
-        """设置UI"""
-        # 使用绝对定位
-        from PySide6.QtWidgets import QLabel
-        
+        """设置UI（子部件用绝对定位）"""
         # 头像区域 - 填满边框内部（不留内边距），利用边框圆角裁剪
         self.icon_label = QLabel(self)
         self.icon_label.setGeometry(0, 0, 160, 180)  # 完全填满上方区域
         self.icon_label.setAlignment(Qt.AlignCenter)
         self.icon_label.setScaledContents(True)  # 让图片自动填满 label
         
-        icon_path = self.persona.get("icon_path", "")
-        if icon_path:
-            from core.media_manager import get_media_manager
-            media_manager = get_media_manager()
-            abs_path = media_manager.get_absolute_path(icon_path)
-            
-            if os.path.exists(abs_path):
-                pixmap = QPixmap(abs_path)
-                if not pixmap.isNull():
-                    # 横向填满，保持比例，裁剪超出部分
-                    scaled_pixmap = pixmap.scaled(
-                        160, 180,  # 卡片头像区域尺寸
-                        Qt.KeepAspectRatioByExpanding,  # 填满区域，保持比例
-                        Qt.SmoothTransformation
-                    )
-                    # 从中心裁剪到目标尺寸
-                    if scaled_pixmap.width() > 160 or scaled_pixmap.height() > 180:
-                        x_offset = max(0, (scaled_pixmap.width() - 160) // 2)
-                        y_offset = max(0, (scaled_pixmap.height() - 180) // 2)
-                        scaled_pixmap = scaled_pixmap.copy(x_offset, y_offset, 160, 180)
-                    self.icon_label.setPixmap(scaled_pixmap)
-                    self.icon_label.setScaledContents(False)  # 已裁剪好，不需要拉伸
-                else:
-                    self.icon_label.setScaledContents(False)
-                    self.icon_label.setText(self.persona.get("icon", "🤖"))
-                    self.icon_label.setFont(QFont("Segoe UI Emoji", 72))
-            else:
-                self.icon_label.setScaledContents(False)
-                self.icon_label.setText(self.persona.get("icon", "🤖"))
-                self.icon_label.setFont(QFont("Segoe UI Emoji", 72))
-        else:
-            self.icon_label.setScaledContents(False)
-            self.icon_label.setText(self.persona.get("icon", "🤖"))
-            self.icon_label.setFont(QFont("Segoe UI Emoji", 72))
+        self._apply_icon()
         
         # 名称区域 - 下方40px，完全填满
         self.name_container = QLabel(self)
@@ -82,7 +174,7 @@ class CarouselCard(QPushButton):
         # 名称标签
         self.name_label = QLabel(self.persona.get("name", "未知"), self)
         self.name_label.setGeometry(5, 185, 150, 30)
-        self.name_label.setFont(QFont("Microsoft YaHei UI", 12, QFont.Bold))
+        self.name_label.setFont(_font("Microsoft YaHei UI", 12, QFont.Bold))
         self.name_label.setAlignment(Qt.AlignCenter)
         self.name_label.setWordWrap(True)
         
@@ -91,49 +183,24 @@ class CarouselCard(QPushButton):
         self.name_container.raise_()
         self.name_label.raise_()
     
-    def set_transform(self, scale: float, opacity: float, z_order: int, is_center: bool = False):
-        """设置变换效果"""
-        self.scale_factor = scale
-        self.opacity_value = opacity
-        self.z_order = z_order
-        
+    def _styles_for(self, opacity: float, is_center: bool):
+        """构建/取出某个状态的四段样式串
+
+        QSS 解析是 Qt 里公认的开销大户，动画期间反复拼接+解析同样的
+        字符串没有意义；非中心态按透明度桶区分，中心态只有一份。
+        """
+        theme_name = self.theme.current.get('name')
+        key = (theme_name, is_center, None if is_center else opacity)
+        cached = CarouselCard._qss_cache.get(key)
+        if cached is not None:
+            return cached
+
         c = self.theme.colors
-        
-        # 获取父组件的基础尺寸
-        parent_widget = self.parent()
-        if isinstance(parent_widget, CarouselWidget):
-            base_width = parent_widget.base_card_width
-            base_height = parent_widget.base_card_height
-        else:
-            base_width = 160
-            base_height = 220
-        
-        # 更新大小
-        new_width = int(base_width * scale)
-        new_height = int(base_height * scale)
-        self.setFixedSize(new_width, new_height)
-        
-        # 更新子组件大小和位置（图片填满边框内部）
-        icon_height = int((base_height * 180 / 220) * scale)
-        icon_width = new_width
-        
-        # 图片区域完全填满，不留内边距
-        self.icon_label.setGeometry(0, 0, icon_width, icon_height)
-        
-        name_height = int((base_height * 40 / 220) * scale)
-        self.name_container.setGeometry(0, icon_height, new_width, name_height)
-        
-        self.name_label.setGeometry(
-            int(5 * scale),
-            icon_height + int(5 * scale),
-            new_width - int(10 * scale),
-            name_height - int(10 * scale)
-        )
-        
-        # 中心卡片特殊样式
         if is_center:
-            # 卡片边框
-            self.setStyleSheet(f"""
+            # 卡片边框 / 头像区顶部圆角（圆角值需要减去边框宽度）/
+            # 名称条主题色渐变 + 底部圆角 / 白色名称文字
+            cached = (
+                f"""
                 QPushButton {{
                     background-color: {c['card_bg']};
                     border: 3px solid {c['accent']};
@@ -142,10 +209,8 @@ class CarouselCard(QPushButton):
                 QPushButton:hover {{
                     border-color: {c['accent_hover']};
                 }}
-            """)
-            
-            # 头像区域背景 + 顶部圆角（圆角值需要减去边框宽度）
-            self.icon_label.setStyleSheet(f"""
+                """,
+                f"""
                 QLabel {{
                     background-color: {c['card_bg']};
                     border-top-left-radius: 17px;
@@ -154,35 +219,24 @@ class CarouselCard(QPushButton):
                     border-bottom-right-radius: 0px;
                     padding: 0px;
                 }}
-            """)
-            
-            # 名称区域渐变背景（主题色渐变）+ 底部圆角
-            self.name_container.setStyleSheet(f"""
-                QLabel {{
-                    background: qlineargradient(
-                        x1:0, y1:0, x2:1, y2:0,
-                        stop:0 {c['accent']},
-                        stop:1 {c['accent_hover']}
-                    );
-                    border-top-left-radius: 0px;
-                    border-top-right-radius: 0px;
-                    border-bottom-left-radius: 17px;
-                    border-bottom-right-radius: 17px;
-                }}
-            """)
-            
-            # 名称文字（白色）
-            self.name_label.setStyleSheet("""
+                """,
+                """
+                QLabel {
+                    background: transparent;
+                }
+                """,
+                """
                 QLabel {
                     color: white;
                     background: transparent;
                 }
-            """)
+                """,
+            )
         else:
-            # 非中心卡片
             border_opacity = int(opacity * 150)
-            
-            self.setStyleSheet(f"""
+            text_opacity = max(0.7, opacity)
+            cached = (
+                f"""
                 QPushButton {{
                     background-color: {c['card_bg']};
                     border: 2px solid rgba(150, 150, 150, {border_opacity});
@@ -191,10 +245,8 @@ class CarouselCard(QPushButton):
                 QPushButton:hover {{
                     border-color: {c['accent']};
                 }}
-            """)
-            
-            # 头像区域背景 + 顶部圆角
-            self.icon_label.setStyleSheet(f"""
+                """,
+                f"""
                 QLabel {{
                     background-color: {c['card_bg']};
                     border-top-left-radius: 16px;
@@ -203,67 +255,110 @@ class CarouselCard(QPushButton):
                     border-bottom-right-radius: 0px;
                     padding: 0px;
                 }}
-            """)
-            
-            # 名称区域渐变背景（较淡的渐变）+ 底部圆角
-            accent_r = int(c['accent'][1:3], 16) if c['accent'].startswith('#') else 0
-            accent_g = int(c['accent'][3:5], 16) if c['accent'].startswith('#') else 122
-            accent_b = int(c['accent'][5:7], 16) if c['accent'].startswith('#') else 255
-            
-            self.name_container.setStyleSheet(f"""
-                QLabel {{
-                    background: qlineargradient(
-                        x1:0, y1:0, x2:1, y2:0,
-                        stop:0 rgba({accent_r}, {accent_g}, {accent_b}, {int(180 * opacity)}),
-                        stop:1 rgba({accent_r}, {accent_g}, {accent_b}, {int(220 * opacity)})
-                    );
-                    border-top-left-radius: 0px;
-                    border-top-right-radius: 0px;
-                    border-bottom-left-radius: 16px;
-                    border-bottom-right-radius: 16px;
-                }}
-            """)
-            
-            # 名称文字（白色，稍淡）
-            text_opacity = max(0.7, opacity)
-            self.name_label.setStyleSheet(f"""
+                """,
+                """
+                QLabel {
+                    background: transparent;
+                }
+                """,
+                f"""
                 QLabel {{
                     color: rgba(255, 255, 255, {int(text_opacity * 255)});
                     background: transparent;
                 }}
-            """)
+                """,
+            )
+
+        CarouselCard._qss_cache[key] = cached
+        return cached
+
+    def set_transform(self, scale: float, opacity: float, z_order: int, is_center: bool = False):
+        """设置变换效果
+
+        scale/opacity 已由 update_positions 量化到桶值，同一桶重复调用
+        时样式、几何、图片都不会有可见变化，直接返回。
+        """
+        self.z_order = z_order
+
+        # 获取父组件的基础尺寸
+        parent_widget = self.parent()
+        if isinstance(parent_widget, CarouselWidget):
+            base_width = parent_widget.base_card_width
+            base_height = parent_widget.base_card_height
+        else:
+            base_width = 160
+            base_height = 220
+
+        key = (scale, opacity, is_center, base_width, base_height)
+        if key == self._last_transform_key:
+            return
+        self._last_transform_key = key
+
+        self.scale_factor = scale
+        self.opacity_value = opacity
+
+        # 更新大小
+        new_width = int(base_width * scale)
+        new_height = int(base_height * scale)
+        self.setFixedSize(new_width, new_height)
+        
+        # 更新子组件大小和位置（图片填满边框内部）
+        icon_height = int((base_height * 180 / 220) * scale)
+        icon_width = new_width
         
+        # 图片区域完全填满，不留内边距
+        self.icon_label.setGeometry(0, 0, icon_width, icon_height)
+        
+        name_height = int((base_height * 40 / 220) * scale)
+        self.name_container.setGeometry(0, icon_height, new_width, name_height)
+        
+        self.name_label.setGeometry(
+            int(5 * scale),
+            icon_height + int(5 * scale),
+            new_width - int(10 * scale),
+            name_height - int(10 * scale)
+        )
+        
+        # 样式串按 (主题, 中心态, 透明度桶) 缓存，命中时零格式化
+        card_qss, icon_qss, bar_qss, label_qss = self._styles_for(opacity, is_center)
+        self.setStyleSheet(card_qss)
+        self.icon_label.setStyleSheet(icon_qss)
+        self.name_container.setStyleSheet(bar_qss)
+        self.name_label.setStyleSheet(label_qss)
+
+        # 名称条渐变用预渲染贴图（按颜色+尺寸走 QPixmapCache）
+        c = self.theme.colors
+        if is_center:
+            start = QColor(c['accent'])
+            end = QColor(c['accent_hover'])
+            bar_radius = 17
+        else:
+            start = QColor(c['accent'])
+            start.setAlpha(int(180 * opacity))
+            end = QColor(c['accent'])
+            end.setAlpha(int(220 * opacity))
+            bar_radius = 16
+        self.name_container.setPixmap(
+            _name_bar_pixmap(start, end, new_width, name_height, bar_radius)
+        )
+
         # 更新字体大小
         icon_size = int(72 * scale)  # 调整为72，因为有内边距
         name_size = max(9, int(12 * scale))
         
         if not self.icon_label.pixmap():
-            self.icon_label.setFont(QFont("Segoe UI Emoji", icon_size))
-        else:
-            # 重新缩放图片（填满区域，保持比例）
-            icon_path = self.persona.get("icon_path", "")
-            if icon_path:
-                from core.media_manager import get_media_manager
-                media_manager = get_media_manager()
-                abs_path = media_manager.get_absolute_path(icon_path)
-                
-                if os.path.exists(abs_path):
-                    pixmap = QPixmap(abs_path)
-                    if not pixmap.isNull():
-                        # 横向填满，保持比例
-                        scaled_pixmap = pixmap.scaled(
-                            icon_width, icon_height,
-                            Qt.KeepAspectRatioByExpanding,  # 填满区域，保持比例
-                            Qt.SmoothTransformation
-                        )
-                        # 从中心裁剪到目标尺寸
-                        if scaled_pixmap.width() > icon_width or scaled_pixmap.height() > icon_height:
-                            x_offset = max(0, (scaled_pixmap.width() - icon_width) // 2)
-                            y_offset = max(0, (scaled_pixmap.height() - icon_height) // 2)
-                            scaled_pixmap = scaled_pixmap.copy(x_offset, y_offset, icon_width, icon_height)
-                        self.icon_label.setPixmap(scaled_pixmap)
-        
-        self.name_label.setFont(QFont("Microsoft YaHei UI", name_size, QFont.Bold))
+            self.icon_label.setFont(_font("Segoe UI Emoji", icon_size))
+        elif self._source_pm is not None:
+            # 重新缩放图片（填满区域，保持比例）：源图已解码，
+            # 目标尺寸的结果走 QPixmapCache；动画途中用最近邻插值，
+            # 动画结束的收尾帧再换回平滑缩放
+            smooth = not (isinstance(parent_widget, CarouselWidget) and parent_widget.is_animating)
+            self.icon_label.setPixmap(
+                _get_scaled_pixmap(self._icon_abs_path, icon_width, icon_height,
+                                   self._source_pm, smooth)
+            )
+        
+        self.name_label.setFont(_font("Microsoft YaHei UI", name_size, QFont.Bold))
 
 
 class CarouselWidget(QWidget):
@@ -278,6 +373,8 @@ class CarouselWidget(QWidget):
         self.current_index = 0
         self.is_animating = False
         self.auto_rotate_timer = None
+        self._rotation_anim = None  # 旋转动画（QPropertyAnimation，C++ 侧驱动）
+        self._trig_table = []  # 每个整数偏移的 (sin, cos)，卡片数变化时重建
         
         # 布局参数（会根据窗口大小自动调整）
         self.radius = 350  # 旋转半径
@@ -289,34 +386,39 @@ class CarouselWidget(QWidget):
         
         self.setMinimumSize(800, 500)
         self.setFocusPolicy(Qt.StrongFocus)
-        
+
+        # 交互式拉伸会产生一连串 resizeEvent，每个都全量重排+重缩放
+        # 卡片太浪费；参数同步更新，重排只对最终尺寸做一次
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self.update_positions)
+
         # 连接主题变更
         self.theme.theme_changed.connect(self.apply_theme)
-    
-    def resizeEvent(self, event):
-        """窗口大小改变时重新计算布局"""
-        super().resizeEvent(event)
-        
+
+    def _recalc_layout_params(self):
+        """按当前窗口尺寸重新计算布局参数（轻量，可每次 resize 同步执行）"""
         width = self.width()
         height = self.height()
-        
+
         # 根据窗口大小自动调整参数
         self.center_x = width // 2
         # 垂直居中
         self.center_y = height // 2
-        
+
         # 半径根据窗口大小调整（使用较小的维度）
         min_dimension = min(width, height)
         self.radius = int(min_dimension * 0.35)
-        
+
         # 根据窗口大小调整卡片基础尺寸
         # 窗口越大，卡片越大
         scale_factor = min(width / 1000, height / 600)  # 基准：1000x600
         scale_factor = max(0.6, min(scale_factor, 1.5))  # 限制在 0.6 ~ 1.5 倍
-        
+
         self.base_card_width = int(160 * scale_factor)
         self.base_card_height = int(220 * scale_factor)
-        
+
         # 可见卡片数量根据窗口宽度调整
         if width < 900:
             self.visible_cards = 3
@@ -324,17 +426,21 @@ class CarouselWidget(QWidget):
             self.visible_cards = 5
         else:
             self.visible_cards = 7
-        
-        # 重新布局
-        self.update_positions()
+
+    def resizeEvent(self, event):
+        """窗口大小改变时重新计算布局（重排去抖到突发结束）"""
+        super().resizeEvent(event)
+        self._recalc_layout_params()
+        self._resize_timer.start()
     
     def set_personas(self, personas: dict):
         """设置助手列表"""
-        # 清空现有卡片
-        for card in self.cards:
-            card.deleteLater()
-        self.cards.clear()
-        
+        # 进行中的旋转动画引用即将销毁的卡片，先停掉
+        if self._rotation_anim is not None:
+            self._rotation_anim.stop()
+            self._rotation_anim = None
+        self.is_animating = False
+
         # 排序：default（通用AI）放在第一位
         sorted_personas = []
         if 'default' in personas:
@@ -342,60 +448,117 @@ class CarouselWidget(QWidget):
         for key, persona in personas.items():
             if key != 'default':
                 sorted_personas.append((key, persona))
-        
-        # 创建新卡片
-        for key, persona in sorted_personas:
-            card = CarouselCard(key, persona, self)
-            card.clicked.connect(lambda checked, k=key: self.on_card_clicked(k))
-            card.hide()
-            self.cards.append(card)
-        
+
+        # 复用已有卡片、按需增删：每张卡是 QPushButton + 3 个 QLabel，
+        # 助手列表刷新时整批重建太浪费
+        while len(self.cards) > len(sorted_personas):
+            self.cards.pop().deleteLater()
+
+        for idx, (key, persona) in enumerate(sorted_personas):
+            if idx < len(self.cards):
+                self.cards[idx].bind(key, persona)
+            else:
+                card = CarouselCard(key, persona, self)
+                # 点击时读 card.key：rebind 后无需重连
+                card.clicked.connect(lambda checked, card=card: self.on_card_clicked(card.key))
+                card.hide()
+                self.cards.append(card)
+
         self.current_index = 0
+        self._rebuild_trig_table()
         self.update_positions()
-    
+
+    def _rebuild_trig_table(self):
+        """预计算每个整数偏移的 (sin, cos)
+
+        angle_step 只随卡片数量变化，三角函数没必要每帧重算；
+        动画中的小数偏移在相邻表项间线性插值。
+        """
+        total = len(self.cards)
+        if total:
+            angle_step = 360.0 / total
+            self._trig_table = [
+                (math.sin(math.radians(k * angle_step)), math.cos(math.radians(k * angle_step)))
+                for k in range(total)
+            ]
+        else:
+            self._trig_table = []
+
     def update_positions(self):
         """更新所有卡片位置"""
         if not self.cards:
             return
-        
+
         total_cards = len(self.cards)
         if total_cards == 0:
             return
-        
-        # 计算每个卡片的角度
-        angle_step = 360.0 / total_cards
-        
+
+        if len(self._trig_table) != total_cards:
+            self._rebuild_trig_table()
+        trig = self._trig_table
+
         # 当前索引可能是浮点数（动画中），需要处理
         current_idx = self.current_index
-        
+
+        # 批量几何/样式变更期间挂起重绘，循环结束后合并成一次
+        self.setUpdatesEnabled(False)
+        try:
+            self._layout_cards(trig, total_cards, current_idx)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _layout_cards(self, trig, total_cards, current_idx):
+        """update_positions 的逐卡布局循环（重绘已由调用方挂起）"""
+
+        # 循环不变量提到循环外：每帧每卡重复取属性/重算纯属开销
+        # （卡片数量级只有十来张，NumPy 向量化在这里并不划算）
+        half_visible = self.visible_cards // 2
+        half_total = total_cards / 2
+        center_x = self.center_x
+        center_y = self.center_y
+        radius = self.radius
+        z_base = radius * 0.6
+        z_span = radius * 1.2
+
         for i, card in enumerate(self.cards):
             # 计算相对于当前中心卡片的偏移
             offset = (i - current_idx + total_cards) % total_cards
-            
+
             # 如果偏移超过一半，从另一侧计算
-            if offset > total_cards / 2:
+            if offset > half_total:
                 offset = offset - total_cards
-            
+
             # 只显示可见范围内的卡片
-            half_visible = self.visible_cards // 2
             if abs(offset) > half_visible:
-                card.hide()
+                # 只在可见->隐藏的翻转帧调用 setVisible，避免每帧都
+                # 触发几何失效和重绘调度
+                if card._is_visible:
+                    card.setVisible(False)
+                    card._is_visible = False
+                    card._last_layout = None
+                    card._last_stack = None
                 continue
             
-            # 计算角度（0度在正前方）
-            angle = offset * angle_step
-            angle_rad = math.radians(angle)
-            
+            # 角度上的 sin/cos 查表（0度在正前方），小数偏移线性插值
+            k = math.floor(offset)
+            frac = offset - k
+            sin_a, cos_a = trig[k % total_cards]
+            if frac:
+                sin_b, cos_b = trig[(k + 1) % total_cards]
+                sin_a += (sin_b - sin_a) * frac
+                cos_a += (cos_b - cos_a) * frac
+
             # 3D 透视效果：椭圆轨迹
-            x_offset = self.radius * math.sin(angle_rad)
-            z_offset = self.radius * 0.6 * math.cos(angle_rad)
-            
+            x_offset = radius * sin_a
+            z_offset = z_base * cos_a
+
             # 计算实际位置
-            x = self.center_x + int(x_offset) - card.width() // 2
-            y = self.center_y - card.height() // 2
-            
+            x = center_x + int(x_offset) - card.width() // 2
+            y = center_y - card.height() // 2
+
             # 根据深度计算缩放和透明度
-            z_normalized = (z_offset + self.radius * 0.6) / (self.radius * 1.2)
+            z_normalized = (z_offset + z_base) / z_span
             
             # 缩放：0.5 ~ 1.3（中心卡片更大）
             # 判断是否是中心卡片（偏移量接近0）
@@ -404,87 +567,96 @@ class CarouselWidget(QWidget):
                 scale = 1.3
             else:
                 scale = 0.5 + z_normalized * 0.6
-            
+
             # 透明度：0.4 ~ 1.0
             opacity = 0.4 + z_normalized * 0.6
+
+            # 量化到桶值：相邻动画帧之间 0.812 和 0.818 的差异肉眼
+            # 不可见，量化后相同桶在 set_transform 里直接跳过，
+            # 缩放图缓存的键空间也随之收敛到桶数
+            scale = round(scale * 32) / 32
+            opacity = round(opacity * 16) / 16
             
             # z-order
             z_order = int(z_normalized * 1000)
-            
+
+            # 与上一帧完全相同（动画尾部缓动饱和时很常见）则整组
+            # move/show/raise 的跨绑定调用都省掉
+            layout_key = (x, y, scale, opacity, is_center)
+            if layout_key == card._last_layout:
+                continue
+            card._last_layout = layout_key
+
             # 应用变换
             card.set_transform(scale, opacity, z_order, is_center)
             card.move(x, y)
-            card.show()
-            
-            # 确保中心卡片在最上层
-            if is_center:
-                card.raise_()
-            else:
-                # 其他卡片按z顺序排列
-                center_index = int(current_idx) % len(self.cards)
-                if 0 <= center_index < len(self.cards):
-                    card.stackUnder(self.cards[center_index])
+            if not card._is_visible:
+                card.setVisible(True)
+                card._is_visible = True
+
+            # 确保中心卡片在最上层；层叠目标未变时不重复调用
+            stack_key = True if is_center else int(current_idx) % total_cards
+            if stack_key != card._last_stack:
+                card._last_stack = stack_key
+                if is_center:
+                    card.raise_()
                 else:
-                    card.stackUnder(card)
+                    # 其他卡片按z顺序排列
+                    card.stackUnder(self.cards[stack_key])
     
+    def _get_rotation_index(self) -> float:
+        return float(self.current_index)
+
+    def _set_rotation_index(self, value: float):
+        self.current_index = value
+        self.update_positions()
+
+    # 旋转位置的 Qt 属性：QPropertyAnimation 在 C++ 侧按合成器节奏
+    # 驱动插值和缓动，Python 只剩每帧一次 setter 调用
+    rotationIndex = Property(float, _get_rotation_index, _set_rotation_index)
+
     def rotate_to(self, index: int, animated: bool = True):
         """旋转到指定索引"""
         if not self.cards or self.is_animating:
             return
-        
+
         index = index % len(self.cards)
-        
+
         if animated:
             self.is_animating = True
-            # 使用定时器实现平滑动画
-            self.animation_steps = 20
-            self.animation_current = 0
-            self.animation_start = self.current_index
-            self.animation_target = index
-            
+
             # 计算最短旋转路径
-            diff = self.animation_target - self.animation_start
+            target = index
+            diff = target - self.current_index
             if abs(diff) > len(self.cards) / 2:
                 if diff > 0:
-                    self.animation_target -= len(self.cards)
+                    target -= len(self.cards)
                 else:
-                    self.animation_target += len(self.cards)
-            
-            self.animation_timer = QTimer(self)
-            self.animation_timer.timeout.connect(self._animate_step)
-            self.animation_timer.start(16)  # ~60 FPS
+                    target += len(self.cards)
+
+            anim = QPropertyAnimation(self, b"rotationIndex", self)
+            anim.setDuration(320)
+            anim.setEasingCurve(QEasingCurve.InOutCubic)
+            anim.setStartValue(float(self.current_index))
+            anim.setEndValue(float(target))
+            anim.finished.connect(lambda: self._on_rotation_finished(index))
+            self._rotation_anim = anim
+            anim.start()
         else:
             self.current_index = index
             self.update_positions()
-    
-    def _animate_step(self):
-        """动画步进"""
-        self.animation_current += 1
-        
-        # 使用缓动函数
-        progress = self.animation_current / self.animation_steps
-        eased_progress = self._ease_in_out_cubic(progress)
-        
-        # 计算当前位置
-        current_pos = self.animation_start + (self.animation_target - self.animation_start) * eased_progress
-        
-        # 临时设置位置（不改变 current_index）
-        old_index = self.current_index
-        self.current_index = current_pos
-        self.update_positions()
-        
-        if self.animation_current >= self.animation_steps:
-            self.animation_timer.stop()
-            self.current_index = self.animation_target % len(self.cards)
+
+    def _on_rotation_finished(self, index: int):
+        """旋转动画结束：索引归一化回整数，并用平滑缩放补一帧收尾"""
+        self.is_animating = False
+        if self.cards:
+            self.current_index = index % len(self.cards)
+            # 末帧与静止帧布局相同，会被各级缓存跳过；清掉缓存键
+            # 强制重放一次，把动画中的快速插值图换成平滑版本
+            for card in self.cards:
+                card._last_layout = None
+                card._last_transform_key = None
             self.update_positions()
-            self.is_animating = False
-    
-    def _ease_in_out_cubic(self, t: float) -> float:
-        """三次缓动函数"""
-        if t < 0.5:
-            return 4 * t * t * t
-        else:
-            return 1 - pow(-2 * t + 2, 3) / 2
     
     def next_card(self):
         """下一张卡片"""
@@ -534,8 +706,9 @@ class CarouselWidget(QWidget):
         c = self.theme.colors
         self.setStyleSheet(f"background-color: {c['bg']};")
         
-        # 更新所有卡片样式
+        # 更新所有卡片样式（换肤后强制重建，跳过缓存）
         for i, card in enumerate(self.cards):
+            card._last_transform_key = None
             if i == self.current_index:
                 card.set_transform(card.scale_factor, card.opacity_value, card.z_order, True)
             else:
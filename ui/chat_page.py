@@ -45,6 +45,9 @@ class ChatPage(QWidget):
         
         # 模型名称映射（显示名称 -> ollama 完整名称）
         self.model_name_map = {}
+
+        # 当前已加载消息的指纹，load_messages 用于跳过无变化的整体重建
+        self._loaded_msg_keys = None
         
         self.setup_ui()
         self.theme.theme_changed.connect(self.apply_theme)
@@ -1303,6 +1306,7 @@ class ChatPage(QWidget):
     
     def clear_messages(self):
         """清空消息区域（不显示欢迎界面）"""
+        self._loaded_msg_keys = None
         while self.chat_layout.count() > 1:
             item = self.chat_layout.takeAt(0)
             if item.widget():
@@ -1310,6 +1314,7 @@ class ChatPage(QWidget):
     
     def remove_last_messages(self, count: int = 1):
         """删除最后 N 条消息气泡"""
+        self._loaded_msg_keys = None
         removed = 0
         # 从倒数第二个开始（最后一个是 stretch）
         while removed < count and self.chat_layout.count() > 1:
@@ -1328,6 +1333,7 @@ class ChatPage(QWidget):
     
     def add_user_message(self, text: str, timestamp: str = None):
         """添加用户消息"""
+        self._loaded_msg_keys = None
         self.clear_welcome()
         if timestamp is None:
             timestamp = datetime.now().isoformat()
@@ -1345,6 +1351,7 @@ class ChatPage(QWidget):
     
     def add_ai_message(self, text: str, timestamp: str = None, model_name: str = None):
         """添加 AI 消息"""
+        self._loaded_msg_keys = None
         if timestamp is None:
             timestamp = datetime.now().isoformat()
         
@@ -1788,27 +1795,41 @@ class ChatPage(QWidget):
             self.model_combo.setCurrentIndex(index)
     
     def load_messages(self, messages: list):
-        """加载历史消息"""
+        """加载历史消息（内容未变化时跳过整体重建）"""
+        msg_keys = [(m.get("role"), m.get("content"), m.get("timestamp"), m.get("model"))
+                    for m in messages]
+        if msg_keys and msg_keys == self._loaded_msg_keys:
+            # 重新打开同一段对话：气泡还在原样，不需要拆了重建
+            self.clear_welcome()
+            return
+
         self.clear_messages()
         self.clear_welcome()
-        
-        current_model = None
-        for msg in messages:
-            model = msg.get("model", "")
-            role = msg.get("role", "")
-            content = msg.get("content", "")
-            timestamp = msg.get("timestamp", "")
-            
-            # 如果模型切换了，显示分隔提示
-            if model and model != current_model:
-                if current_model is not None:
-                    self._add_model_separator(self._simplify_model_name(model))
-                current_model = model
-            
-            if role == "user":
-                self.add_user_message(content, timestamp)
-            elif role == "assistant":
-                self.add_ai_message(content, timestamp, model)
+
+        # 批量插入气泡时先关掉重绘，N 次布局+绘制合并成最后 1 次
+        self.chat_container.setUpdatesEnabled(False)
+        try:
+            current_model = None
+            for msg in messages:
+                model = msg.get("model", "")
+                role = msg.get("role", "")
+                content = msg.get("content", "")
+                timestamp = msg.get("timestamp", "")
+
+                # 如果模型切换了，显示分隔提示
+                if model and model != current_model:
+                    if current_model is not None:
+                        self._add_model_separator(self._simplify_model_name(model))
+                    current_model = model
+
+                if role == "user":
+                    self.add_user_message(content, timestamp)
+                elif role == "assistant":
+                    self.add_ai_message(content, timestamp, model)
+        finally:
+            self.chat_container.setUpdatesEnabled(True)
+
+        self._loaded_msg_keys = msg_keys
     
     def _add_model_separator(self, model_name: str):
         """添加模型切换分隔线"""
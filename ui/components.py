@@ -5,8 +5,9 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QFrame, QProgressBar, QComboBox
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, Signal, QTimer, QAbstractListModel, QModelIndex, QSize
+from PySide6.QtGui import QFont, QPainter, QPainterPath, QColor, QPixmap
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle
 
 from .themes import get_theme_manager
 
@@ -575,184 +576,175 @@ class ChatBubble(QFrame):
         self.avatar.setText("🤖" if not self.is_user else "👤")
         self.avatar.setStyleSheet("")
 
-class HistoryItem(QPushButton):
-    """历史记录项"""
-    
-    clicked_with_data = Signal(dict)
-    delete_requested = Signal(str)
-    
-    def __init__(self, data: dict, parent=None):
+class ChatHistoryModel(QAbstractListModel):
+    """历史记录列表模型
+
+    每行只保存纯数据（原始历史 dict + 预排版好的显示字段），
+    绘制交给 HistoryItemDelegate。条目数量不影响控件开销：
+    视图只为可见行调用 paint，不再为每条历史创建一个 QWidget。
+    """
+
+    DataRole = Qt.UserRole          # 原始历史 dict（filename/persona 等）
+    InfoRole = Qt.UserRole + 1      # 第二行：时间 · 消息数
+    AvatarRole = Qt.UserRole + 2    # QPixmap 或 emoji 字符串
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.data = data
-        self.is_active = False
-        self.theme = get_theme_manager()
-        self.setup_ui()
-        self.theme.theme_changed.connect(self.apply_theme)
-    
-    def setup_ui(self):
-        from PySide6.QtWidgets import QHBoxLayout, QVBoxLayout, QSizePolicy
-        from PySide6.QtGui import QPixmap
-        from core.media_manager import get_media_manager
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return row['title_text']
+        if role == self.InfoRole:
+            return row['info_text']
+        if role == self.AvatarRole:
+            return row['avatar']
+        if role == self.DataRole:
+            return row['data']
+        return None
+
+    def set_histories(self, histories: list):
+        """整表刷新历史记录"""
         from core.database import get_database
-        
-        # 设置按钮的最小高度和大小策略
-        self.setMinimumHeight(65)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        
-        # 创建布局
-        main_layout = QHBoxLayout(self)
-        main_layout.setContentsMargins(10, 8, 10, 8)
-        main_layout.setSpacing(12)
-        
-        # 获取助手信息
-        persona_key = self.data.get('persona', 'default')
+
         db = get_database()
-        persona = db.get_persona(persona_key)
-        
-        # 头像
-        avatar_label = QLabel()
-        avatar_label.setFixedSize(45, 45)
-        avatar_label.setAlignment(Qt.AlignCenter)
-        avatar_label.setStyleSheet("border: none; background: transparent;")
-        
-        if persona:
-            icon_path = persona.get('icon_path', '')
-            if icon_path:
-                media_manager = get_media_manager()
-                abs_path = media_manager.get_absolute_path(icon_path)
-                if os.path.exists(abs_path):
-                    pixmap = QPixmap(abs_path)
-                    if not pixmap.isNull():
-                        scaled_pixmap = pixmap.scaled(45, 45, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                        avatar_label.setPixmap(scaled_pixmap)
-                        avatar_label.setStyleSheet("border: none; border-radius: 22px; background: transparent;")
-                    else:
-                        avatar_label.setText(persona.get('icon', '🤖'))
-                        avatar_label.setFont(QFont("Segoe UI Emoji", 22))
-                        avatar_label.setStyleSheet("border: none; background: transparent;")
-                else:
-                    avatar_label.setText(persona.get('icon', '🤖'))
-                    avatar_label.setFont(QFont("Segoe UI Emoji", 22))
-                    avatar_label.setStyleSheet("border: none; background: transparent;")
-            else:
-                avatar_label.setText(persona.get('icon', '🤖'))
-                avatar_label.setFont(QFont("Segoe UI Emoji", 22))
-                avatar_label.setStyleSheet("border: none; background: transparent;")
-        else:
-            avatar_label.setText('🤖')
-            avatar_label.setFont(QFont("Segoe UI Emoji", 22))
-            avatar_label.setStyleSheet("border: none; background: transparent;")
-        
-        main_layout.addWidget(avatar_label, 0, Qt.AlignVCenter)
-        
-        # 文本信息
-        text_layout = QVBoxLayout()
-        text_layout.setSpacing(3)
-        text_layout.setContentsMargins(0, 0, 0, 0)
-        
+        persona_cache = {}
+
+        self.beginResetModel()
+        self._rows = []
+        for h in histories:
+            persona_key = h.get('persona', 'default')
+            if persona_key not in persona_cache:
+                persona_cache[persona_key] = db.get_persona(persona_key)
+            self._rows.append(self._build_row(h, persona_cache[persona_key]))
+        self.endResetModel()
+
+    def remove_history(self, filename: str):
+        """按文件名删除一行（增量删除，不整表重置）"""
+        for i, row in enumerate(self._rows):
+            if row['data'].get('filename', '') == filename:
+                self.beginRemoveRows(QModelIndex(), i, i)
+                del self._rows[i]
+                self.endRemoveRows()
+                return True
+        return False
+
+    @staticmethod
+    def _build_row(data: dict, persona: dict) -> dict:
+        """预排版一行的显示字段（标题截断、头像加载只做一次）"""
+        from core.media_manager import get_media_manager
+
         # 标题和助手名称
-        title = self.data.get('title', '未命名对话')
+        title = data.get('title', '未命名对话')
         if len(title) > 15:
             title = title[:15] + "..."
-        
+
         persona_name = persona.get('name', '默认助手') if persona else '默认助手'
         if len(persona_name) > 10:
             persona_name = persona_name[:10] + "..."
-        title_text = f"{title} -- {persona_name}"
-        
-        self.title_label = QLabel(title_text)
-        self.title_label.setFont(QFont("Microsoft YaHei UI", 10, QFont.Medium))
-        self.title_label.setWordWrap(False)
-        self.title_label.setStyleSheet("border: none; background: transparent;")
-        text_layout.addWidget(self.title_label)
-        
+
         # 时间和消息数
-        timestamp = self.data.get('timestamp', '')[:10]
-        msg_count = self.data.get('messages_count', 0)
-        
-        self.info_label = QLabel(f"{timestamp} · {msg_count}条消息")
-        self.info_label.setFont(QFont("Microsoft YaHei UI", 9))
-        self.info_label.setStyleSheet("border: none; background: transparent;")
-        text_layout.addWidget(self.info_label)
-        
-        main_layout.addLayout(text_layout, 1)
-        
-        self.setCursor(Qt.PointingHandCursor)
-        self.clicked.connect(lambda: self.clicked_with_data.emit(self.data))
-        self.apply_theme()
-    
-    def apply_theme(self, theme=None):
+        timestamp = data.get('timestamp', '')[:10]
+        msg_count = data.get('messages_count', 0)
+
+        # 头像：有图片文件用 QPixmap，否则用 emoji
+        avatar = persona.get('icon', '🤖') if persona else '🤖'
+        if persona and persona.get('icon_path', ''):
+            media_manager = get_media_manager()
+            abs_path = media_manager.get_absolute_path(persona['icon_path'])
+            if os.path.exists(abs_path):
+                pixmap = QPixmap(abs_path)
+                if not pixmap.isNull():
+                    avatar = pixmap.scaled(45, 45, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+
+        return {
+            'data': data,
+            'title_text': f"{title} -- {persona_name}",
+            'info_text': f"{timestamp} · {msg_count}条消息",
+            'avatar': avatar,
+        }
+
+
+class HistoryItemDelegate(QStyledItemDelegate):
+    """历史记录项绘制代理：用 QPainter 直接画出原 HistoryItem 的外观"""
+
+    ITEM_HEIGHT = 65
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.theme = get_theme_manager()
+        self._title_font = QFont("Microsoft YaHei UI", 10, QFont.Medium)
+        self._info_font = QFont("Microsoft YaHei UI", 9)
+        self._emoji_font = QFont("Segoe UI Emoji", 22)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ITEM_HEIGHT)
+
+    def paint(self, painter, option, index):
         c = self.theme.colors
-        
-        if self.is_active:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {c['active']};
-                    border: 1px solid {c['accent']};
-                    border-radius: 10px;
-                }}
-                QPushButton QLabel {{
-                    border: none;
-                    background: transparent;
-                }}
-            """)
-            if hasattr(self, 'title_label'):
-                self.title_label.setStyleSheet(f"color: {c['text']}; border: none; background: transparent;")
-            if hasattr(self, 'info_label'):
-                self.info_label.setStyleSheet(f"color: {c['text_secondary']}; border: none; background: transparent;")
+        rect = option.rect
+
+        is_active = bool(option.state & QStyle.State_Selected)
+        is_hover = bool(option.state & QStyle.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # 背景卡片（选中高亮 > 悬停 > 普通）
+        if is_active:
+            bg_color, border_color = c['active'], c['accent']
+        elif is_hover:
+            bg_color, border_color = c['hover'], c['accent']
         else:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {c['card_bg']};
-                    border: 1px solid {c['border']};
-                    border-radius: 10px;
-                }}
-                QPushButton:hover {{
-                    background-color: {c['hover']};
-                    border-color: {c['accent']};
-                }}
-                QPushButton QLabel {{
-                    border: none;
-                    background: transparent;
-                }}
-            """)
-            if hasattr(self, 'title_label'):
-                self.title_label.setStyleSheet(f"color: {c['text']}; border: none; background: transparent;")
-            if hasattr(self, 'info_label'):
-                self.info_label.setStyleSheet(f"color: {c['text_secondary']}; border: none; background: transparent;")
-    
-    def set_active(self, active: bool):
-        self.is_active = active
-        self.apply_theme()
-    
-    def contextMenuEvent(self, event):
-        from PySide6.QtWidgets import QMenu
-        c = self.theme.colors
-        
-        menu = QMenu(self)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {c['card_bg']};
-                color: {c['text']};
-                border: 1px solid {c['border']};
-                border-radius: 10px;
-                padding: 8px;
-            }}
-            QMenu::item {{
-                padding: 10px 20px;
-                border-radius: 6px;
-            }}
-            QMenu::item:selected {{
-                background-color: {c['hover']};
-            }}
-        """)
-        
-        delete_action = menu.addAction("🗑️ 删除对话")
-        delete_action.triggered.connect(
-            lambda: self.delete_requested.emit(self.data.get('filename', ''))
-        )
-        
-        menu.exec(event.globalPos())
+            bg_color, border_color = c['card_bg'], c['border']
+
+        card = rect.adjusted(0, 0, -1, -1)
+        path = QPainterPath()
+        path.addRoundedRect(card, 10, 10)
+        painter.fillPath(path, QColor(bg_color))
+        painter.setPen(QColor(border_color))
+        painter.drawPath(path)
+
+        # 头像（45x45，垂直居中）
+        avatar = index.data(ChatHistoryModel.AvatarRole)
+        avatar_rect = rect.adjusted(10, 0, 0, 0)
+        avatar_rect.setTop(rect.top() + (rect.height() - 45) // 2)
+        avatar_rect.setSize(QSize(45, 45))
+
+        if isinstance(avatar, QPixmap):
+            clip = QPainterPath()
+            clip.addEllipse(avatar_rect)
+            painter.setClipPath(clip)
+            painter.drawPixmap(avatar_rect, avatar)
+            painter.setClipping(False)
+        else:
+            painter.setFont(self._emoji_font)
+            painter.setPen(QColor(c['text']))
+            painter.drawText(avatar_rect, Qt.AlignCenter, avatar or '🤖')
+
+        # 文本区域（标题 + 时间/消息数两行）
+        text_left = rect.left() + 10 + 45 + 12
+        text_rect = rect.adjusted(text_left - rect.left(), 8, -10, -8)
+
+        painter.setFont(self._title_font)
+        painter.setPen(QColor(c['text']))
+        title = index.data(Qt.DisplayRole) or ''
+        title = painter.fontMetrics().elidedText(title, Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignTop, title)
+
+        painter.setFont(self._info_font)
+        painter.setPen(QColor(c['text_secondary']))
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignBottom, index.data(ChatHistoryModel.InfoRole) or '')
+
+        painter.restore()
 
 
 class ModelCard(QFrame):
@@ -193,6 +193,9 @@ def get_theme_manager() -> ThemeManager:
     return ThemeManager()
 
 
+_stylesheet_cache = {}
+
+
 def get_stylesheet(theme: dict = None) -> str:
     """生成样式表（兼容层）
     
@@ -202,13 +205,17 @@ def get_stylesheet(theme: dict = None) -> str:
         manager = _get_new_theme_manager()
         return manager.get_stylesheet()
     
-    # 旧的样式表生成逻辑（保留作为后备）
+    # 旧的样式表生成逻辑（保留作为后备），按主题名缓存避免重复拼接
     if theme is None:
         theme = get_theme_manager().current
     
     c = theme
+    theme_name = theme.get('name', 'dark')
+    cached = _stylesheet_cache.get(theme_name)
+    if cached is not None:
+        return cached
     
-    return f"""
+    qss = f"""
     /* 全局样式 */
     QMainWindow, QWidget {{
         background-color: {c['bg']};
@@ -398,4 +405,6 @@ def get_stylesheet(theme: dict = None) -> str:
         min-width: 80px;
         padding: 8px 16px;
     }}
-    """
\ No newline at end of file
+    """
+    _stylesheet_cache[theme_name] = qss
+    return qss
\ No newline at end of file